@@ -3,6 +3,7 @@ Hello World Skill
 Simple example skill that greets a user.
 """
 
+import asyncio
 from typing import Dict, Any
 from pathlib import Path
 
@@ -23,9 +24,11 @@ async def run(input_payload: Dict[str, Any]) -> Dict[str, Any]:
     # Create greeting
     greeting = f"Hello, {name}! Welcome to open-skills."
 
-    # Write greeting to an output file (optional artifact)
+    # Write greeting to an output file (optional artifact).
+    # The blocking write runs in a worker thread so the executor's event
+    # loop stays free to serve other concurrent skill runs.
     output_file = Path("greeting.txt")
-    output_file.write_text(greeting)
+    await asyncio.to_thread(output_file.write_bytes, greeting.encode())
 
     # Return outputs and artifacts
     return {
@@ -4,30 +4,16 @@ Example: Integrating open-skills into any FastAPI app (Library Mode)
 This demonstrates how to embed open-skills as a library in your existing API.
 """
 
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from open_skills.integrations.fastapi_integration import mount_open_skills
 
-# Your existing FastAPI app
-app = FastAPI(title="My Agent API")
-
-
-# Your existing endpoints
-@app.get("/")
-async def root():
-    return {"message": "My Agent API with Skills"}
-
-
-@app.post("/chat")
-async def chat(message: str):
-    """Your chat endpoint - skills will be available here"""
-    # Your agent logic here
-    # Skills are auto-discovered via /.well-known/skills.json
-    return {"response": "I can now use skills!"}
-
 
-# Register open-skills on startup
-@app.on_event("startup")
-async def startup():
+# Register open-skills before the app starts serving (lifespan runs to the
+# yield before requests are routed, so nothing races a cold setup)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     # One-line integration!
     await mount_open_skills(
         app,
@@ -42,6 +28,25 @@ async def startup():
     # - Discoverable at /.well-known/skills.json
     # - Manageable via /skills/* API
     # - Executable via your agent
+    yield
+
+
+# Your existing FastAPI app
+app = FastAPI(title="My Agent API", lifespan=lifespan)
+
+
+# Your existing endpoints
+@app.get("/")
+async def root():
+    return {"message": "My Agent API with Skills"}
+
+
+@app.post("/chat")
+async def chat(message: str):
+    """Your chat endpoint - skills will be available here"""
+    # Your agent logic here
+    # Skills are auto-discovered via /.well-known/skills.json
+    return {"response": "I can now use skills!"}
 
 
 if __name__ == "__main__":
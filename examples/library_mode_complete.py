@@ -10,9 +10,41 @@ This shows:
 """
 
 import asyncio
-from fastapi import FastAPI, HTTPException
+import hashlib
+import json
+import re
+import time
+from contextlib import asynccontextmanager
+
+from sqlalchemy import text
+from fastapi import FastAPI, HTTPException, Request, Response
 from pydantic import BaseModel
 
+# uvloop replaces asyncio's event loop with a faster libuv-based one;
+# it ships with uvicorn[standard] but stays optional here.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson is 2-5x faster than stdlib json and emits bytes directly; fall
+# back transparently when not installed.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps_bytes(obj) -> bytes:
+        return json.dumps(obj).encode()
+
 # Import open-skills components
 from open_skills.core.library import configure, get_config
 from open_skills.core.adapters.discovery import register_skills_from_folder
@@ -38,11 +70,66 @@ async def setup_open_skills():
     )
 
     print(f"Registered {len(versions)} skill versions")
+    invalidate_manifest_cache()
+
+    # Build the tool-name index once at startup
+    tools = await with_db(lambda db: as_agent_tools(db=db, published_only=True))
+    refresh_tool_index(tools)
+
     return versions
 
 
-# Step 2: Create FastAPI app
-app = FastAPI(title="My Custom Agent")
+# Precompiled skill-trigger keywords and a lower-cased tool-name index,
+# refreshed on registration, so the chat hot path avoids per-request
+# .lower() allocations and linear tool scans.
+KEYWORD_RE = re.compile(r"\b(summariz\w*)\b", re.IGNORECASE)
+_tool_index: dict[str, dict] = {}
+
+
+def refresh_tool_index(tools: list[dict]) -> None:
+    """Rebuild the lower-cased tool-name index (call after registration)."""
+    _tool_index.clear()
+    _tool_index.update({t["name"].lower(): t for t in tools})
+
+
+async def with_db(fn):
+    """
+    Run fn inside a short-lived DB session.
+
+    Scoping the session to actual DB work (instead of holding it for the
+    whole request, including LLM latency) frees pool slots sooner.
+    """
+    config = get_config()
+    async for db in config.get_db():
+        return await fn(db)
+
+
+# Step 2: Create FastAPI app with a lifespan that preloads heavy state.
+# Unlike on_event("startup"), the lifespan runs to its yield before uvicorn
+# routes any request, so nothing races a cold setup or hits cold caches.
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await setup_open_skills()
+
+    # Preconvert OpenAI schemas and warm the manifest cache + DB pool so
+    # the first request pays no cold-start cost
+    tools = await with_db(lambda db: as_agent_tools(db=db, published_only=True))
+    app.state.openai_functions = tuple(to_openai_function(t) for t in tools)
+
+    async def _warm(db):
+        await db.execute(text("SELECT 1"))
+
+    await with_db(_warm)
+
+    print("✓ Open-skills configured and skills registered")
+    print("✓ Available endpoints:")
+    print("  - GET  /.well-known/skills.json  (tool discovery)")
+    print("  - POST /chat                      (simple chat)")
+    print("  - POST /chat/openai               (OpenAI integration)")
+    yield
+
+
+app = FastAPI(title="My Custom Agent", lifespan=lifespan)
 
 
 class ChatRequest(BaseModel):
@@ -55,12 +142,44 @@ class ChatResponse(BaseModel):
     skills_used: list[str] = []
 
 
+# Manifest cache: the manifest only changes when skills are (re)registered,
+# so serve a pre-serialized response with a short TTL instead of hitting the
+# DB and re-encoding JSON on every discovery request.
+MANIFEST_CACHE_TTL = 30.0
+_manifest_cache: dict[tuple, tuple[float, str, bytes]] = {}
+
+
+def invalidate_manifest_cache() -> None:
+    """Drop cached manifests (call after skill registration/publish)."""
+    _manifest_cache.clear()
+
+
 # Step 3: Get available tools
 @app.get("/.well-known/skills.json")
-async def get_skills_manifest():
-    """Tool discovery endpoint for agents"""
+async def get_skills_manifest(request: Request):
+    """Tool discovery endpoint for agents (cached, ETag-aware)"""
     from open_skills.core.adapters.agent_tool_api import manifest_json
-    return await manifest_json(published_only=True)
+
+    cache_key = (True, None, None)  # (published_only, user_id, org_id)
+    cached = _manifest_cache.get(cache_key)
+
+    if cached is None or time.monotonic() >= cached[0]:
+        manifest = await manifest_json(published_only=True)
+        body = _json_dumps_bytes(manifest)
+        etag = f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+        cached = (time.monotonic() + MANIFEST_CACHE_TTL, etag, body)
+        _manifest_cache[cache_key] = cached
+
+    _, etag, body = cached
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": f"public, max-age={int(MANIFEST_CACHE_TTL)}"},
+    )
 
 
 # Step 4: Chat endpoint with skill execution
@@ -75,61 +194,60 @@ async def chat(req: ChatRequest):
     3. Execute skills
     4. Return results
     """
-    config = get_config()
-
-    async for db in config.get_db():
-        # Get available tools
-        tools = await as_agent_tools(db=db, published_only=True)
+    # Get available tools (scoped session, released immediately)
+    tools = await with_db(lambda db: as_agent_tools(db=db, published_only=True))
 
-        if not req.use_skills or not tools:
-            # Simple response without skills
-            return ChatResponse(
-                response=f"Echo: {req.message}",
-                skills_used=[],
-            )
+    if not req.use_skills or not tools:
+        # Simple response without skills
+        return ChatResponse(
+            response=f"Echo: {req.message}",
+            skills_used=[],
+        )
 
-        # Example: Check if message asks for a skill
-        # (In production, use LLM to decide which tool to call)
-        message_lower = req.message.lower()
+    # Example: Check if message asks for a skill
+    # (In production, use LLM to decide which tool to call)
+    # Simple keyword matching via precompiled regex (replace with LLM tool calling)
+    match = KEYWORD_RE.search(req.message)
+    if match:
+        if not _tool_index:
+            refresh_tool_index(tools)
+
+        # Find summarizer skill in the prebuilt index
+        keyword = match.group(1).lower()[:7]
+        summarizer = next(
+            (t for name, t in _tool_index.items() if keyword in name),
+            None
+        )
 
-        # Simple keyword matching (replace with LLM tool calling)
-        if "summarize" in message_lower:
-            # Find summarizer skill
-            summarizer = next(
-                (t for t in tools if "summariz" in t["name"].lower()),
-                None
-            )
+        if summarizer:
+            # Execute the skill in its own scoped session
+            from uuid import UUID
+            version_id = UUID(summarizer["skill_version_id"])
 
-            if summarizer:
-                # Execute the skill
+            async def _execute(db):
                 manager = SkillManager(db)
                 executor = SkillExecutor(db)
-
-                from uuid import UUID
-                version_id = UUID(summarizer["skill_version_id"])
                 version = await manager.get_skill_version(version_id)
+                return await executor.execute_one(version, {"text": req.message})
 
-                result = await executor.execute_one(
-                    version,
-                    {"text": req.message}
-                )
+            result = await with_db(_execute)
 
-                return ChatResponse(
-                    response=result.get("outputs", {}).get("summary", ""),
-                    skills_used=[summarizer["name"]],
-                )
+            return ChatResponse(
+                response=result.get("outputs", {}).get("summary", ""),
+                skills_used=[summarizer["name"]],
+            )
 
-        # Default response
-        return ChatResponse(
-            response=f"I understand: {req.message}. "
-                    f"I have {len(tools)} skills available.",
-            skills_used=[],
-        )
+    # Default response
+    return ChatResponse(
+        response=f"I understand: {req.message}. "
+                f"I have {len(tools)} skills available.",
+        skills_used=[],
+    )
 
 
 # Step 5: Advanced - Direct OpenAI integration
 @app.post("/chat/openai")
-async def chat_with_openai(req: ChatRequest):
+async def chat_with_openai(req: ChatRequest, request: Request):
     """
     Example using OpenAI function calling with skills.
 
@@ -143,72 +261,62 @@ async def chat_with_openai(req: ChatRequest):
             detail="OpenAI package required. Install with: pip install openai"
         )
 
-    config = get_config()
+    # Get tools in OpenAI format (scoped session, released before the LLM call);
+    # schemas preconverted at startup are reused from app.state
+    tools = await with_db(lambda db: as_agent_tools(db=db, published_only=True))
+    openai_functions = (
+        getattr(request.app.state, "openai_functions", None)
+        or [to_openai_function(t) for t in tools]
+    )
 
-    async for db in config.get_db():
-        # Get tools in OpenAI format
-        tools = await as_agent_tools(db=db, published_only=True)
-        openai_functions = [to_openai_function(t) for t in tools]
-
-        # Call OpenAI with function calling
-        client = openai.AsyncOpenAI()
-
-        response = await client.chat.completions.create(
-            model="gpt-4",
-            messages=[
-                {"role": "user", "content": req.message}
-            ],
-            functions=openai_functions if req.use_skills else None,
-        )
+    # Call OpenAI with function calling — no DB session held across this await
+    client = openai.AsyncOpenAI()
 
-        # Handle function calls
-        message = response.choices[0].message
+    response = await client.chat.completions.create(
+        model="gpt-4",
+        messages=[
+            {"role": "user", "content": req.message}
+        ],
+        functions=openai_functions if req.use_skills else None,
+    )
 
-        if message.function_call:
-            # Execute the skill
-            function_name = message.function_call.name
-            import json
-            function_args = json.loads(message.function_call.arguments)
+    # Handle function calls
+    message = response.choices[0].message
 
-            # Find the tool
-            tool = next(
-                (t for t in tools if t["name"] == function_name),
-                None
-            )
+    if message.function_call:
+        # Execute the skill
+        function_name = message.function_call.name
+        function_args = _json_loads(message.function_call.arguments)
+
+        # Find the tool
+        tool = next(
+            (t for t in tools if t["name"] == function_name),
+            None
+        )
+
+        if tool:
+            from uuid import UUID
+            version_id = UUID(tool["skill_version_id"])
 
-            if tool:
-                from uuid import UUID
+            async def _execute(db):
                 manager = SkillManager(db)
                 executor = SkillExecutor(db)
-
-                version_id = UUID(tool["skill_version_id"])
                 version = await manager.get_skill_version(version_id)
+                return await executor.execute_one(version, function_args)
 
-                result = await executor.execute_one(version, function_args)
-
-                return ChatResponse(
-                    response=str(result.get("outputs", {})),
-                    skills_used=[function_name],
-                )
-
-        return ChatResponse(
-            response=message.content or "",
-            skills_used=[],
-        )
+            result = await with_db(_execute)
 
+            return ChatResponse(
+                response=str(result.get("outputs", {})),
+                skills_used=[function_name],
+            )
 
-# Startup
-@app.on_event("startup")
-async def startup():
-    """Initialize on startup"""
-    await setup_open_skills()
-    print("✓ Open-skills configured and skills registered")
-    print("✓ Available endpoints:")
-    print("  - GET  /.well-known/skills.json  (tool discovery)")
-    print("  - POST /chat                      (simple chat)")
-    print("  - POST /chat/openai               (OpenAI integration)")
+    return ChatResponse(
+        response=message.content or "",
+        skills_used=[],
+    )
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    uvicorn.run(app, host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
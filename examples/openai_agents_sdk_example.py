@@ -9,11 +9,36 @@ Requires: pip install openai
 
 import asyncio
 import json
+import time
 from typing import Any, Dict
 from uuid import UUID
 
 import openai
 
+# uvloop replaces asyncio's event loop with a faster libuv-based one;
+# it ships with uvicorn[standard] but stays optional here.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson is 2-5x faster than stdlib json for the small payloads flying
+# around the agent loop; fall back transparently when not installed.
+try:
+    import orjson
+
+    def _json_loads(data):
+        return orjson.loads(data)
+
+    def _json_dumps(obj) -> str:
+        # OpenAI expects str content, orjson produces bytes
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _json_loads = json.loads
+    _json_dumps = json.dumps
+
 from open_skills import (
     configure,
     register_skills_from_folder,
@@ -27,6 +52,28 @@ from open_skills.core.executor import SkillExecutor
 from open_skills.core.library import get_config
 
 
+# Converted tool schemas are stable between skill registrations, so cache
+# them per (published_only,) instead of re-running as_agent_tools +
+# to_openai_tool on every agent startup.
+_tools_cache: dict[tuple, tuple[tuple, tuple]] = {}
+
+
+async def load_openai_tools(published_only: bool = True) -> tuple[tuple, tuple]:
+    """Return (tools, openai_tools) tuples, cached until invalidated."""
+    key = (published_only,)
+    cached = _tools_cache.get(key)
+    if cached is None:
+        tools = await as_agent_tools(published_only=published_only)
+        cached = (tuple(tools), tuple(to_openai_tool(t) for t in tools))
+        _tools_cache[key] = cached
+    return cached
+
+
+def invalidate_tools_cache() -> None:
+    """Drop cached tool schemas (call after skill registration)."""
+    _tools_cache.clear()
+
+
 async def setup():
     """Setup open-skills in library mode."""
     configure(
@@ -41,22 +88,64 @@ async def setup():
         auto_publish=True,
         visibility="org",
     )
+    invalidate_tools_cache()
+    invalidate_version_cache()
     print(f"✓ Registered {len(versions)} skills")
 
 
-async def execute_skill_from_tool_call(tool_call, db):
+# Cap concurrent skill executions so a burst of tool calls cannot exhaust
+# the DB pool.
+_exec_semaphore = asyncio.Semaphore(8)
+
+
+# Repeated tool calls in one agent loop usually hit the same skill version;
+# a short-TTL cache turns the per-call DB fetch into a dict lookup.
+_VERSION_CACHE_TTL = 60.0
+_version_cache: dict[UUID, tuple[float, Any]] = {}
+
+
+async def get_skill_version_cached(skill_version_id: UUID, db):
+    """Fetch a SkillVersion, serving repeats from a short-TTL memory cache."""
+    entry = _version_cache.get(skill_version_id)
+    if entry is not None and time.monotonic() < entry[0]:
+        return entry[1]
+
+    version = await SkillManager(db).get_skill_version(skill_version_id)
+    _version_cache[skill_version_id] = (time.monotonic() + _VERSION_CACHE_TTL, version)
+    return version
+
+
+def invalidate_version_cache() -> None:
+    """Drop cached skill versions (call after publish/unpublish)."""
+    _version_cache.clear()
+
+
+async def with_db(fn):
+    """
+    Run fn inside a short-lived DB session.
+
+    Acquiring the session only around actual DB work (instead of holding it
+    across LLM calls) frees pool slots during OpenAI latency.
+    """
+    config = get_config()
+    async for db in config.get_db():
+        return await fn(db)
+
+
+async def execute_skill_from_tool_call(tool_call, db, version=None):
     """
     Execute a skill based on OpenAI tool call.
 
     Args:
         tool_call: OpenAI tool call object
         db: Database session
+        version: Optional prefetched SkillVersion (skips the per-call fetch)
 
     Returns:
         Skill execution result
     """
     function_name = tool_call.function.name
-    arguments = json.loads(tool_call.function.arguments)
+    arguments = _json_loads(tool_call.function.arguments)
 
     print(f"\n🔧 Executing skill: {function_name}")
     print(f"   Arguments: {arguments}")
@@ -65,11 +154,12 @@ async def execute_skill_from_tool_call(tool_call, db):
     skill_version_id = UUID(arguments.pop("skill_version_id"))
 
     # Execute the skill
-    manager = SkillManager(db)
-    executor = SkillExecutor(db)
+    async with _exec_semaphore:
+        executor = SkillExecutor(db)
 
-    version = await manager.get_skill_version(skill_version_id)
-    result = await executor.execute_one(version, arguments)
+        if version is None:
+            version = await get_skill_version_cached(skill_version_id, db)
+        result = await executor.execute_one(version, arguments)
 
     print(f"✓ Execution completed in {result['duration_ms']}ms")
     print(f"   Status: {result['status']}")
@@ -88,9 +178,8 @@ async def run_agent_loop():
     # Setup
     await setup()
 
-    # Get tools
-    tools = await as_agent_tools(published_only=True)
-    openai_tools = [to_openai_tool(t) for t in tools]
+    # Get tools (cached conversion)
+    tools, openai_tools = await load_openai_tools(published_only=True)
 
     print(f"\n📋 Available tools: {len(openai_tools)}")
     for tool in tools:
@@ -137,52 +226,76 @@ async def run_agent_loop():
     max_iterations = 5
     iteration = 0
 
-    config = get_config()
-    async for db in config.get_db():
-        while iteration < max_iterations:
-            iteration += 1
-            print(f"\n📍 Iteration {iteration}")
-
-            # Call OpenAI with tools
-            response = await client.chat.completions.create(
-                model="gpt-4",
-                messages=messages,
-                tools=openai_tools,
-                tool_choice="auto",  # Let the model decide
+    while iteration < max_iterations:
+        iteration += 1
+        print(f"\n📍 Iteration {iteration}")
+
+        # Call OpenAI with tools (no DB session held across this await)
+        response = await client.chat.completions.create(
+            model="gpt-4",
+            messages=messages,
+            tools=openai_tools,
+            tool_choice="auto",  # Let the model decide
+        )
+
+        message = response.choices[0].message
+        messages.append(message)
+
+        # Check if we're done
+        if message.content and not message.tool_calls:
+            print(f"\n💬 Assistant: {message.content}")
+            break
+
+        # Handle tool calls
+        if message.tool_calls:
+            print(f"\n🔨 Tool calls requested: {len(message.tool_calls)}")
+
+            # Prefetch all referenced skill versions in one SELECT, then
+            # execute independent skills concurrently, each in its own
+            # session — AsyncSession is not safe for concurrent use, so
+            # sharing one across the gather would raise on the first turn
+            # with two tool calls. Latency still drops from the sum to
+            # the max of durations.
+            ids = [
+                UUID(_json_loads(tc.function.arguments)["skill_version_id"])
+                for tc in message.tool_calls
+            ]
+            versions = await with_db(
+                lambda db: SkillManager(db).get_skill_versions(list(set(ids)))
             )
 
-            message = response.choices[0].message
-            messages.append(message)
-
-            # Check if we're done
-            if message.content and not message.tool_calls:
-                print(f"\n💬 Assistant: {message.content}")
-                break
-
-            # Handle tool calls
-            if message.tool_calls:
-                print(f"\n🔨 Tool calls requested: {len(message.tool_calls)}")
-
-                for tool_call in message.tool_calls:
-                    # Execute the skill
-                    result = await execute_skill_from_tool_call(tool_call, db)
-
-                    # Add tool result to conversation
-                    messages.append({
-                        "role": "tool",
-                        "tool_call_id": tool_call.id,
-                        "name": tool_call.function.name,
-                        "content": json.dumps({
-                            "status": result["status"],
-                            "outputs": result["outputs"],
-                            "duration_ms": result["duration_ms"],
-                        })
-                    })
-
-            # Continue loop to get final response
-
-        if iteration >= max_iterations:
-            print("\n⚠️ Max iterations reached")
+            async def _run_tool(tc, version):
+                async with get_config().session() as db:
+                    return await execute_skill_from_tool_call(
+                        tc, db, version=version
+                    )
+
+            results = await asyncio.gather(*(
+                _run_tool(tc, versions.get(vid))
+                for tc, vid in zip(message.tool_calls, ids)
+            ))
+
+            # Build all tool messages in one pass (re-paired with their
+            # tool_call_ids in the original order) and extend once.
+            tool_messages = [
+                {
+                    "role": "tool",
+                    "tool_call_id": tool_call.id,
+                    "name": tool_call.function.name,
+                    "content": _json_dumps({
+                        "status": result["status"],
+                        "outputs": result["outputs"],
+                        "duration_ms": result["duration_ms"],
+                    }),
+                }
+                for tool_call, result in zip(message.tool_calls, results)
+            ]
+            messages.extend(tool_messages)
+
+        # Continue loop to get final response
+
+    if iteration >= max_iterations:
+        print("\n⚠️ Max iterations reached")
 
     print("\n" + "="*60)
     print("✅ Agent Loop Complete")
@@ -197,9 +310,8 @@ async def simple_tool_calling_example():
     """
     await setup()
 
-    # Get tools
-    tools = await as_agent_tools(published_only=True)
-    openai_tools = [to_openai_tool(t) for t in tools]
+    # Get tools (cached conversion)
+    tools, openai_tools = await load_openai_tools(published_only=True)
 
     # Call OpenAI
     client = openai.AsyncOpenAI()
@@ -217,11 +329,12 @@ async def simple_tool_calling_example():
     if message.tool_calls:
         print(f"🔨 Model wants to call {len(message.tool_calls)} tool(s)")
 
-        config = get_config()
-        async for db in config.get_db():
+        async def _run_calls(db):
             for tool_call in message.tool_calls:
                 result = await execute_skill_from_tool_call(tool_call, db)
                 print(f"✓ Result: {result['outputs']}")
+
+        await with_db(_run_calls)
     else:
         print(f"💬 Direct response: {message.content}")
 
@@ -242,9 +355,9 @@ async def swarm_pattern_example():
             self.instructions = instructions
             self.tools = tools
 
-    # Get all available skills as tools
-    all_tools = await as_agent_tools(published_only=True)
-    openai_tools = [to_openai_tool(t) for t in all_tools]
+    # Get all available skills as tools (cached conversion); the per-agent
+    # subset is materialized once at construction, not per request.
+    all_tools, openai_tools = await load_openai_tools(published_only=True)
 
     # Create specialized agent
     summarization_agent = SkillAgent(
@@ -6,6 +6,15 @@ skill metadata into system prompts.
 """
 
 import asyncio
+
+# uvloop replaces asyncio's event loop with a faster libuv-based one;
+# it ships with uvicorn[standard] but stays optional here.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
 from open_skills import (
     configure,
     register_skills_from_folder,
@@ -15,6 +24,20 @@ from open_skills import (
 )
 
 
+def configure_once():
+    """
+    Configure open-skills for the examples.
+
+    configure() memoizes identical arguments, so every example can call
+    this defensively without re-creating the engine and pool each time.
+    """
+    configure(
+        database_url="postgresql+asyncpg://localhost:5432/openskills",
+        openai_api_key="sk-...",
+        storage_root="./skills",
+    )
+
+
 async def basic_prompt_injection():
     """
     Basic example: Generate a skills-aware system prompt.
@@ -23,12 +46,8 @@ async def basic_prompt_injection():
     print("Basic Prompt Injection Example")
     print("=" * 60)
 
-    # Setup
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-        storage_root="./skills",
-    )
+    # Setup (no-op if already configured)
+    configure_once()
 
     # Register skills
     await register_skills_from_folder("./skills", auto_publish=True)
@@ -64,10 +83,7 @@ async def compact_format_example():
     print("Compact Format Example")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     # Compact format - good for saving tokens
     skills_context = await manifest_to_prompt(format="compact")
@@ -84,10 +100,7 @@ async def inject_into_existing_prompt():
     print("Inject into Existing Prompt")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     # Your existing system prompt
     base_prompt = """You are a professional AI assistant.
@@ -113,10 +126,7 @@ async def session_metadata_example():
     print("Session Metadata for Observability")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     # Get metadata about available skills
     metadata = await get_skills_session_metadata(published_only=True)
@@ -138,10 +148,7 @@ async def multi_tenant_example():
     print("Multi-Tenant Skill Context")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     from uuid import uuid4
 
@@ -168,10 +175,7 @@ async def framework_integration_example():
     print("Framework-Specific Integration")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     from open_skills import manifest_to_tools
 
@@ -196,10 +200,7 @@ async def real_world_agent_example():
     print("Real-World Agent Setup")
     print("=" * 60)
 
-    configure(
-        database_url="postgresql+asyncpg://localhost:5432/openskills",
-        openai_api_key="sk-...",
-    )
+    configure_once()
 
     # Register skills
     await register_skills_from_folder("./skills", auto_publish=True)
@@ -251,8 +252,18 @@ if __name__ == "__main__":
         for name in examples.keys():
             print(f"  python prompt_injection_example.py {name}")
         print("\nRunning all examples...")
-        asyncio.run(basic_prompt_injection())
-        asyncio.run(compact_format_example())
-        asyncio.run(inject_into_existing_prompt())
-        asyncio.run(session_metadata_example())
-        asyncio.run(real_world_agent_example())
+
+        async def _run_all():
+            # One event loop and connection pool shared across demos;
+            # configure_once() makes the per-demo configure calls no-ops,
+            # and independent demos overlap their I/O.
+            configure_once()
+            await asyncio.gather(
+                basic_prompt_injection(),
+                compact_format_example(),
+                inject_into_existing_prompt(),
+                session_metadata_example(),
+                real_world_agent_example(),
+            )
+
+        asyncio.run(_run_all())
@@ -8,89 +8,208 @@ This demonstrates:
 """
 
 import asyncio
+import sys
+
 import httpx
 from uuid import UUID
 
+# uvloop replaces asyncio's event loop with a faster libuv-based one;
+# it ships with uvicorn[standard] but stays optional here.
+try:
+    import uvloop
+
+    uvloop.install()
+except ImportError:
+    pass
+
+# orjson parses small JSON payloads several times faster than stdlib json;
+# fall back transparently when it is not installed.
+try:
+    import orjson
+
+    _loads = orjson.loads
+except ImportError:
+    import json
+
+    _loads = json.loads
+
+# Shared client: reusing one AsyncClient across runs keeps pooled keep-alive
+# connections warm instead of paying a TCP+TLS handshake per invocation.
+_client: httpx.AsyncClient | None = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """Lazily create the shared HTTP client."""
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            timeout=300.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        )
+    return _client
+
+
+async def close_client() -> None:
+    """Close the shared client at process shutdown."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def _on_status(data: dict, emit) -> bool:
+    emit(f"📊 Status: {data.get('status')}\n")
+    return False
+
+
+def _on_log(data: dict, emit) -> bool:
+    stream = data.get("stream", "stdout")
+    emit(f"📝 [{stream}] {data.get('line')}\n")
+    return False
 
-async def execute_and_stream(skill_version_id: UUID, input_data: dict):
+
+def _on_output(data: dict, emit) -> bool:
+    emit(f"📤 Output: {data.get('key')} = {data.get('value')}\n")
+    return False
+
+
+def _on_artifact(data: dict, emit) -> bool:
+    size_kb = data.get("size_bytes", 0) / 1024
+    emit(f"📎 Artifact: {data.get('filename')} ({size_kb:.2f} KB)\n")
+    return False
+
+
+def _on_error(data: dict, emit) -> bool:
+    emit(f"❌ Error: {data.get('error')}\n")
+    if "traceback" in data:
+        emit(f"   Traceback: {data['traceback'][:200]}...\n")
+    return False
+
+
+def _on_complete(data: dict, emit) -> bool:
+    emit(f"\n✅ Complete!\n")
+    emit(f"   Status: {data.get('status')}\n")
+    emit(f"   Duration: {data.get('duration_ms')}ms\n")
+    emit(f"   Outputs: {data.get('outputs', {})}\n")
+    return True  # Stop streaming
+
+
+def _on_keepalive(data: dict, emit) -> bool:
+    # Keepalive ping (no action needed)
+    return False
+
+
+# How many events to accumulate before writing to stdout; buffering avoids
+# a syscall + flush per event in the hot receive loop.
+FLUSH_EVERY = 64
+
+# O(1) event dispatch instead of a growing if/elif cascade; handlers take
+# (data, emit) and return True to stop streaming.
+HANDLERS = {
+    "status": _on_status,
+    "log": _on_log,
+    "output": _on_output,
+    "artifact": _on_artifact,
+    "error": _on_error,
+    "complete": _on_complete,
+    "keepalive": _on_keepalive,
+}
+
+
+async def execute_and_stream(
+    skill_version_id: UUID,
+    input_data: dict,
+    client: httpx.AsyncClient | None = None,
+):
     """
     Execute a skill and stream real-time updates.
 
     Args:
         skill_version_id: Skill version UUID to execute
         input_data: Input payload for the skill
+        client: Optional shared HTTP client (defaults to the module singleton)
     """
     base_url = "http://localhost:8000/api"
 
-    async with httpx.AsyncClient(timeout=300.0) as client:
-        # 1. Start execution
-        print(f"🚀 Starting execution of skill {skill_version_id}...")
-        run_response = await client.post(
-            f"{base_url}/runs",
-            json={
-                "skill_version_ids": [str(skill_version_id)],
-                "input": input_data,
-            }
-        )
-        run_response.raise_for_status()
-        run_data = run_response.json()
-        run_id = run_data["results"][0]["run_id"]
-        print(f"✓ Run created: {run_id}")
-
-        # 2. Stream execution events
-        print(f"\n📡 Streaming events for run {run_id}...\n")
-
-        async with client.stream("GET", f"{base_url}/runs/{run_id}/stream") as response:
-            response.raise_for_status()
-
-            async for line in response.aiter_lines():
-                # SSE format: "event: type\ndata: json\n\n"
-                if line.startswith("event:"):
-                    event_type = line.split(":", 1)[1].strip()
-                elif line.startswith("data:"):
-                    import json
-                    event_data = json.loads(line.split(":", 1)[1].strip())
-
-                    # Handle different event types
-                    if event_type == "status":
-                        status = event_data.get("status")
-                        print(f"📊 Status: {status}")
-
-                    elif event_type == "log":
-                        log_line = event_data.get("line")
-                        stream = event_data.get("stream", "stdout")
-                        print(f"📝 [{stream}] {log_line}")
-
-                    elif event_type == "output":
-                        key = event_data.get("key")
-                        value = event_data.get("value")
-                        print(f"📤 Output: {key} = {value}")
-
-                    elif event_type == "artifact":
-                        filename = event_data.get("filename")
-                        size_bytes = event_data.get("size_bytes", 0)
-                        size_kb = size_bytes / 1024
-                        print(f"📎 Artifact: {filename} ({size_kb:.2f} KB)")
-
-                    elif event_type == "error":
-                        error = event_data.get("error")
-                        print(f"❌ Error: {error}")
-                        if "traceback" in event_data:
-                            print(f"   Traceback: {event_data['traceback'][:200]}...")
-
-                    elif event_type == "complete":
-                        status = event_data.get("status")
-                        duration_ms = event_data.get("duration_ms")
-                        outputs = event_data.get("outputs", {})
-                        print(f"\n✅ Complete!")
-                        print(f"   Status: {status}")
-                        print(f"   Duration: {duration_ms}ms")
-                        print(f"   Outputs: {outputs}")
-                        break  # Stop streaming
-
-                    elif event_type == "keepalive":
-                        # Keepalive ping (no action needed)
-                        pass
+    if client is None:
+        client = get_client()
+
+    # 1. Start execution
+    print(f"🚀 Starting execution of skill {skill_version_id}...")
+    run_response = await client.post(
+        f"{base_url}/runs",
+        json={
+            "skill_version_ids": [str(skill_version_id)],
+            "input": input_data,
+        }
+    )
+    run_response.raise_for_status()
+    run_data = run_response.json()
+    run_id = run_data["results"][0]["run_id"]
+    print(f"✓ Run created: {run_id}")
+
+    # 2. Stream execution events
+    print(f"\n📡 Streaming events for run {run_id}...\n")
+
+    async with client.stream("GET", f"{base_url}/runs/{run_id}/stream") as response:
+        response.raise_for_status()
+
+        # Accumulate raw bytes and split on blank-line frame boundaries
+        # ("event: type\ndata: json\n\n") instead of per-line string ops.
+        # SSE allows CRLF, CR, or LF line endings — sse-starlette (which
+        # backs /runs/{id}/stream) emits CRLF — so normalize everything to
+        # LF first. A trailing CR is held back in case its LF arrives in
+        # the next chunk, otherwise a split CRLF would fake a blank line.
+        buf = bytearray()
+        pending_cr = False
+        done = False
+
+        # Handler output is buffered and flushed every FLUSH_EVERY events
+        # (and on error/complete) instead of printing per event.
+        out: list[str] = []
+        emit = out.append
+        event_count = 0
+
+        async for chunk in response.aiter_bytes():
+            if pending_cr:
+                chunk = b"\r" + chunk
+            pending_cr = chunk.endswith(b"\r")
+            if pending_cr:
+                chunk = chunk[:-1]
+            buf.extend(chunk.replace(b"\r\n", b"\n").replace(b"\r", b"\n"))
+
+            while not done and (frame_end := buf.find(b"\n\n")) != -1:
+                frame = bytes(buf[:frame_end])
+                del buf[:frame_end + 2]
+
+                event_type = None
+                data_bytes = None
+                for field in frame.split(b"\n"):
+                    if field.startswith(b"event:"):
+                        event_type = field[6:].strip().decode()
+                    elif field.startswith(b"data:"):
+                        data_bytes = field[5:].strip()
+
+                if event_type is None or data_bytes is None:
+                    continue
+
+                event_data = _loads(data_bytes)
+
+                # Handle different event types
+                handler = HANDLERS.get(event_type)
+                if handler is not None and handler(event_data, emit):
+                    done = True
+
+                event_count += 1
+                if done or event_type == "error" or event_count % FLUSH_EVERY == 0:
+                    sys.stdout.write("".join(out))
+                    out.clear()
+
+            if done:
+                break
+
+        if out:
+            sys.stdout.write("".join(out))
 
 
 async def main():
@@ -103,11 +222,17 @@ async def main():
     }
 
     try:
-        await execute_and_stream(skill_version_id, input_data)
+        async with httpx.AsyncClient(
+            timeout=300.0,
+            limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+        ) as client:
+            await execute_and_stream(skill_version_id, input_data, client=client)
     except httpx.HTTPStatusError as e:
         print(f"HTTP error: {e.response.status_code} - {e.response.text}")
     except Exception as e:
         print(f"Error: {e}")
+    finally:
+        await close_client()
 
 
 if __name__ == "__main__":
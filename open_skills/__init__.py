@@ -4,49 +4,115 @@ open-skills: A modular, Anthropic-style Skills subsystem for agent frameworks.
 Framework-agnostic design supporting both library mode (embedded) and service mode (sidecar).
 """
 
+import importlib
+
 __version__ = "0.2.0"
 
-# Library mode - Core components
-from .core.manager import SkillManager
-from .core.router import SkillRouter
-from .core.executor import SkillExecutor
-from .core.library import configure, get_config, is_configured
+# PEP 562 lazy loading: attribute name -> (module, attribute). Submodules
+# (and their FastAPI/SQLAlchemy dependency trees) import on first access
+# instead of at `import open_skills`, keeping cold-import and CLI startup
+# time low.
+_LAZY = {
+    # Library mode - Core components
+    "SkillManager": ("open_skills.core.manager", "SkillManager"),
+    "SkillRouter": ("open_skills.core.router", "SkillRouter"),
+    "SkillExecutor": ("open_skills.core.executor", "SkillExecutor"),
+    "SkillContext": ("open_skills.core.executor", "SkillContext"),
+    "get_workdir": ("open_skills.core.executor", "get_workdir"),
+    # Library configuration
+    "configure": ("open_skills.core.library", "configure"),
+    "get_config": ("open_skills.core.library", "get_config"),
+    "is_configured": ("open_skills.core.library", "is_configured"),
+    # Discovery
+    "register_skills_from_folder": (
+        "open_skills.core.adapters.discovery",
+        "register_skills_from_folder",
+    ),
+    "watch_skills_folder": (
+        "open_skills.core.adapters.discovery",
+        "watch_skills_folder",
+    ),
+    # Tool API
+    "as_agent_tools": ("open_skills.core.adapters.agent_tool_api", "as_agent_tools"),
+    "iter_agent_tools": (
+        "open_skills.core.adapters.agent_tool_api",
+        "iter_agent_tools",
+    ),
+    "manifest_stream": (
+        "open_skills.core.adapters.agent_tool_api",
+        "manifest_stream",
+    ),
+    "manifest_json": ("open_skills.core.adapters.agent_tool_api", "manifest_json"),
+    "manifest_bytes": ("open_skills.core.adapters.agent_tool_api", "manifest_bytes"),
+    "to_openai_function": (  # Legacy
+        "open_skills.core.adapters.agent_tool_api",
+        "to_openai_function",
+    ),
+    "to_openai_tool": (  # Modern
+        "open_skills.core.adapters.agent_tool_api",
+        "to_openai_tool",
+    ),
+    "to_anthropic_tool": (
+        "open_skills.core.adapters.agent_tool_api",
+        "to_anthropic_tool",
+    ),
+    "to_langchain_tool": (
+        "open_skills.core.adapters.agent_tool_api",
+        "to_langchain_tool",
+    ),
+    # Prompt injection
+    "manifest_to_prompt": (
+        "open_skills.core.adapters.prompt_injection",
+        "manifest_to_prompt",
+    ),
+    "manifest_to_tools": (
+        "open_skills.core.adapters.prompt_injection",
+        "manifest_to_tools",
+    ),
+    "inject_skills_context": (
+        "open_skills.core.adapters.prompt_injection",
+        "inject_skills_context",
+    ),
+    "get_skills_session_metadata": (
+        "open_skills.core.adapters.prompt_injection",
+        "get_skills_session_metadata",
+    ),
+    # Streaming
+    "get_event_bus": ("open_skills.core.streaming", "get_event_bus"),
+    "emit_status": ("open_skills.core.streaming", "emit_status"),
+    "emit_log": ("open_skills.core.streaming", "emit_log"),
+    "emit_output": ("open_skills.core.streaming", "emit_output"),
+    "emit_artifact": ("open_skills.core.streaming", "emit_artifact"),
+    "emit_error": ("open_skills.core.streaming", "emit_error"),
+    "emit_complete": ("open_skills.core.streaming", "emit_complete"),
+    # FastAPI integration
+    "mount_open_skills": (
+        "open_skills.integrations.fastapi_integration",
+        "mount_open_skills",
+    ),
+    "mount_tools_only": (
+        "open_skills.integrations.fastapi_integration",
+        "mount_tools_only",
+    ),
+    # Service mode - Re-export for backwards compatibility
+    "service_app": ("open_skills.service.main", "app"),
+}
 
-# Library mode - Discovery and tools
-from .core.adapters.discovery import register_skills_from_folder, watch_skills_folder
-from .core.adapters.agent_tool_api import (
-    as_agent_tools,
-    manifest_json,
-    to_openai_function,  # Legacy
-    to_openai_tool,      # Modern
-    to_anthropic_tool,
-    to_langchain_tool,
-)
 
-# Prompt injection for context awareness
-from .core.adapters.prompt_injection import (
-    manifest_to_prompt,
-    manifest_to_tools,
-    inject_skills_context,
-    get_skills_session_metadata,
-)
+def __getattr__(name: str):
+    """Resolve lazily exported attributes on first access (PEP 562)."""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    obj = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = obj  # Cache so subsequent accesses skip __getattr__
+    return obj
 
-# Streaming
-from .core.streaming import (
-    get_event_bus,
-    emit_status,
-    emit_log,
-    emit_output,
-    emit_artifact,
-    emit_error,
-    emit_complete,
-)
 
-# FastAPI integration
-from .integrations.fastapi_integration import mount_open_skills, mount_tools_only
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY))
 
-# Service mode - Re-export for backwards compatibility
-from .service.main import app as service_app
 
 __all__ = [
     # Version
@@ -55,6 +121,8 @@ __all__ = [
     "SkillManager",
     "SkillRouter",
     "SkillExecutor",
+    "SkillContext",
+    "get_workdir",
     # Library configuration
     "configure",
     "get_config",
@@ -64,7 +132,10 @@ __all__ = [
     "watch_skills_folder",
     # Tool API
     "as_agent_tools",
+    "iter_agent_tools",
     "manifest_json",
+    "manifest_bytes",
+    "manifest_stream",
     "to_openai_function",  # Legacy
     "to_openai_tool",      # Modern
     "to_anthropic_tool",
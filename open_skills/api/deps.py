@@ -6,13 +6,13 @@ Includes database sessions, authentication, and RBAC checks.
 from typing import Optional, AsyncGenerator
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status, Header
+from fastapi import Depends, HTTPException, Request, status, Header
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from open_skills.core.rbac import RBACManager, Permission
 from open_skills.core.exceptions import PermissionDeniedError, AuthenticationError
 from open_skills.db.base import get_db as get_db_session
-from open_skills.db.models import User
+from open_skills.db.models import SkillPermission, User
 from sqlalchemy import select
 
 
@@ -55,10 +55,21 @@ async def get_current_user(
 
     try:
         user_id = UUID(x_user_id)
+        # Load the user and their permission rows in one round-trip;
+        # downstream RBAC checks consume the preloaded rows in memory
+        # instead of issuing a second query per permission check
         result = await db.execute(
-            select(User).where(User.id == user_id)
+            select(User, SkillPermission)
+            .outerjoin(SkillPermission, SkillPermission.user_id == User.id)
+            .where(User.id == user_id)
         )
-        return result.scalar_one_or_none()
+        rows = result.all()
+        if not rows:
+            return None
+
+        user = rows[0][0]
+        user._preloaded_permissions = [perm for _, perm in rows if perm is not None]
+        return user
     except (ValueError, Exception):
         return None
 
@@ -86,43 +97,51 @@ async def require_user(
     return current_user
 
 
-class RequireRole:
-    """Dependency class for requiring specific roles."""
+async def get_rbac(db: AsyncSession = Depends(get_db)) -> RBACManager:
+    """
+    Get RBAC manager dependency.
 
-    def __init__(self, required_permission: Permission):
-        """
-        Initialize role requirement.
+    Args:
+        db: Database session
 
-        Args:
-            required_permission: Permission required
-        """
-        self.required_permission = required_permission
+    Returns:
+        RBACManager instance
+    """
+    return RBACManager(db)
 
-    async def __call__(
-        self,
-        current_user: User = Depends(require_user),
-        db: AsyncSession = Depends(get_db),
-    ) -> User:
-        """
-        Check if user has required permission.
 
-        Args:
-            current_user: Current user
-            db: Database session
+def require(permission: Permission):
+    """
+    Build a dependency that requires a specific permission.
 
-        Returns:
-            User instance if authorized
+    Results are memoized on request.state, so endpoints that stack
+    several role dependencies check each (user, permission) pair at
+    most once per request.
 
-        Raises:
-            HTTPException: 403 if permission denied
-        """
-        rbac = RBACManager(db)
+    Args:
+        permission: Permission the endpoint requires
+
+    Returns:
+        Dependency callable yielding the authorized User
+    """
+
+    async def _dep(
+        request: Request,
+        current_user: User = Depends(require_user),
+        rbac: RBACManager = Depends(get_rbac),
+    ) -> User:
+        cache = request.state.__dict__.setdefault("_rbac_cache", {})
+        key = (current_user.id, permission)
+        if key in cache:
+            return current_user
 
         try:
             await rbac.require_permission(
                 user_id=current_user.id,
-                permission=self.required_permission,
+                permission=permission,
+                user=current_user,
             )
+            cache[key] = True
             return current_user
         except PermissionDeniedError as e:
             raise HTTPException(
@@ -130,25 +149,14 @@ class RequireRole:
                 detail=str(e),
             )
 
-
-# Convenience dependencies for common role checks
-require_viewer = RequireRole(Permission.VIEW_SKILL)
-require_author = RequireRole(Permission.CREATE_SKILL)
-require_publisher = RequireRole(Permission.PUBLISH_VERSION)
-require_admin = RequireRole(Permission.MANAGE_PERMISSIONS)
+    return _dep
 
 
-async def get_rbac(db: AsyncSession = Depends(get_db)) -> RBACManager:
-    """
-    Get RBAC manager dependency.
-
-    Args:
-        db: Database session
-
-    Returns:
-        RBACManager instance
-    """
-    return RBACManager(db)
+# Convenience dependencies for common role checks
+require_viewer = require(Permission.VIEW_SKILL)
+require_author = require(Permission.CREATE_SKILL)
+require_publisher = require(Permission.PUBLISH_VERSION)
+require_admin = require(Permission.MANAGE_PERMISSIONS)
 
 
 # Optional user dependency (doesn't require authentication)
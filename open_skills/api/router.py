@@ -22,7 +22,7 @@ from open_skills.api.deps import (
     get_pagination,
     Pagination,
 )
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.manager import SkillManager
 from open_skills.core.router import SkillRouter
 from open_skills.core.executor import SkillExecutor
@@ -49,7 +49,7 @@ async def health_check():
     from datetime import datetime, timezone
     return schemas.HealthResponse(
         status="healthy",
-        version=settings.app_version,
+        version=get_settings().app_version,
         timestamp=datetime.now(timezone.utc),
     )
 
@@ -13,6 +13,21 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import print as rprint
 
+# orjson is 3-5x faster than stdlib json; for inputs up to the 10MB
+# limit the parse dominates run_local's startup cost. Optional.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
 from open_skills.core.packing import (
     parse_skill_bundle,
     validate_skill_bundle,
@@ -109,11 +124,24 @@ def validate(bundle_path: str):
         raise click.Abort()
 
 
+# Display caps for run_local: skills can legitimately return megabytes
+# of output, but rendering that through Rich blocks for seconds and
+# floods the terminal. Full results go to --json-out instead.
+_OUTPUT_PREVIEW_CHARS = 8192
+_LOG_PREVIEW_CHARS = 4096
+
+
 @cli.command()
 @click.argument("bundle_path", type=click.Path(exists=True))
 @click.argument("input_file", type=click.Path(exists=True))
 @click.option("--timeout", type=int, default=60, help="Execution timeout in seconds")
-def run_local(bundle_path: str, input_file: str, timeout: int):
+@click.option(
+    "--json-out",
+    type=click.Path(),
+    default=None,
+    help="Write the full (untruncated) result to this file as JSON",
+)
+def run_local(bundle_path: str, input_file: str, timeout: int, json_out: Optional[str]):
     """
     Run a skill locally without uploading to server.
 
@@ -121,17 +149,20 @@ def run_local(bundle_path: str, input_file: str, timeout: int):
         bundle_path: Path to skill bundle directory
         input_file: Path to JSON file with input data
         timeout: Execution timeout in seconds
+        json_out: Optional path for the full result JSON
     """
     async def _run():
         try:
             bundle = parse_skill_bundle(Path(bundle_path))
             console.print(f"[bold]Running skill:[/bold] {bundle.metadata.get('name')}")
 
-            # Load input
-            with open(input_file, "r") as f:
-                input_data = json.load(f)
+            # Load input off the event loop — input files can be up to
+            # max_input_size_bytes (10MB), enough to stall the loop
+            input_data = await asyncio.to_thread(
+                lambda: _loads(Path(input_file).read_bytes())
+            )
 
-            console.print(f"[dim]Input:[/dim] {json.dumps(input_data, indent=2)}")
+            console.print(f"[dim]Input:[/dim] {_dumps(input_data)}")
 
             # Create a mock SkillVersion for local execution
             from open_skills.db.base import AsyncSessionLocal
@@ -167,7 +198,13 @@ def run_local(bundle_path: str, input_file: str, timeout: int):
 
                 if result.get("outputs"):
                     console.print("\n[bold]Outputs:[/bold]")
-                    console.print(json.dumps(result["outputs"], indent=2))
+                    preview = _dumps(result["outputs"])
+                    if len(preview) > _OUTPUT_PREVIEW_CHARS:
+                        preview = (
+                            preview[:_OUTPUT_PREVIEW_CHARS]
+                            + "\n… [truncated, use --json-out for the full result]"
+                        )
+                    console.print(preview)
 
                 if result.get("artifacts"):
                     console.print("\n[bold]Artifacts:[/bold]")
@@ -176,7 +213,16 @@ def run_local(bundle_path: str, input_file: str, timeout: int):
 
                 if result.get("logs"):
                     console.print("\n[bold]Logs:[/bold]")
-                    console.print(Panel(result["logs"]))
+                    logs = result["logs"]
+                    if len(logs) > _LOG_PREVIEW_CHARS:
+                        logs = logs[:_LOG_PREVIEW_CHARS] + "\n… [truncated]"
+                    console.print(Panel(logs))
+
+                if json_out:
+                    await asyncio.to_thread(
+                        Path(json_out).write_text, _dumps(result)
+                    )
+                    console.print(f"\n[dim]Full result written to:[/dim] {json_out}")
 
         except Exception as e:
             console.print(f"\n[red]✗ Execution failed:[/red] {e}")
@@ -3,10 +3,11 @@ Configuration management using Pydantic Settings.
 Loads environment variables with validation and type checking.
 """
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -38,7 +39,9 @@ class Settings(BaseSettings):
         description="PostgreSQL connection URL with asyncpg driver",
     )
     db_echo: bool = False  # SQLAlchemy echo SQL statements
-    db_pool_size: int = 5
+    # Sized for concurrent skill runs sharing the one process-wide engine;
+    # 5 connections stalled under moderate parallel execution
+    db_pool_size: int = 20
     db_max_overflow: int = 10
 
     # OpenAI (for embeddings)
@@ -87,6 +90,11 @@ class Settings(BaseSettings):
     max_input_size_bytes: int = 10 * 1024 * 1024  # 10MB
     max_artifact_size_bytes: int = 100 * 1024 * 1024  # 100MB
     max_artifacts_per_run: int = 20
+    max_cached_skills: int = 128  # loaded-entrypoint cache size (LRU)
+    sync_workers: int = 4  # process pool size for isolation:process skills
+    max_log_bytes: int = 256 * 1024  # per-run captured stdout/stderr tail
+    max_concurrent_runs: int = 16  # pooled run workdirs (bounds concurrency)
+    max_parallel_runs: int = 8  # execute_many parallel fan-out bound
 
     # CORS
     cors_origins: list[str] = Field(
@@ -101,13 +109,31 @@ class Settings(BaseSettings):
     )
     log_format: str = "json"  # or "text"
 
+    # Lazily-created directory flags (avoid repeat mkdir syscalls)
+    _storage_ready: bool = PrivateAttr(default=False)
+    _artifacts_ready: bool = PrivateAttr(default=False)
+
     @field_validator("storage_root", "artifacts_root")
     @classmethod
-    def ensure_directories(cls, v: Path) -> Path:
-        """Ensure storage directories exist."""
-        v.mkdir(parents=True, exist_ok=True)
+    def resolve_directories(cls, v: Path) -> Path:
+        """Resolve storage paths to absolute; directories are created
+        lazily on first use, not at settings construction."""
         return v.absolute()
 
+    def ensure_storage_root(self) -> Path:
+        """Create storage_root on first use and return it."""
+        if not self._storage_ready:
+            self.storage_root.mkdir(parents=True, exist_ok=True)
+            self._storage_ready = True
+        return self.storage_root
+
+    def ensure_artifacts_root(self) -> Path:
+        """Create artifacts_root on first use and return it."""
+        if not self._artifacts_ready:
+            self.artifacts_root.mkdir(parents=True, exist_ok=True)
+            self._artifacts_ready = True
+        return self.artifacts_root
+
     @field_validator("postgres_url")
     @classmethod
     def validate_postgres_url(cls, v: str) -> str:
@@ -134,21 +160,18 @@ class Settings(BaseSettings):
         return self.environment == "development"
 
 
-# Global settings instance
-_settings: Optional[Settings] = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """
     Get global settings instance (singleton pattern).
 
+    Built lazily on first call so importing this module doesn't pay for
+    .env parsing, validation, or storage-directory creation.
+
     Returns:
         Settings: Application settings
     """
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 def reload_settings() -> Settings:
@@ -158,10 +181,5 @@ def reload_settings() -> Settings:
     Returns:
         Settings: Fresh settings instance
     """
-    global _settings
-    _settings = Settings()
-    return _settings
-
-
-# Convenience export
-settings = get_settings()
+    get_settings.cache_clear()
+    return get_settings()
@@ -3,17 +3,78 @@ Universal tool manifest and agent integration API.
 Provides standard tool contracts compatible with any LLM framework.
 """
 
-from typing import Dict, Any, List, Optional
+import asyncio
+from functools import lru_cache
+from typing import AsyncIterator, Dict, Any, List, Optional
 from uuid import UUID
 from datetime import datetime, timezone
 
-from sqlalchemy import select, and_
+import json
+
+from sqlalchemy import func, select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
+# orjson serializes 3-10x faster than stdlib json and emits bytes
+# directly (handling UUID/datetime natively in C); fall back
+# transparently when not installed.
+try:
+    import orjson
+
+    def _dumps_bytes(obj) -> bytes:
+        return orjson.dumps(obj, default=str)
+
+    def _dumps_sorted(obj) -> str:
+        return orjson.dumps(
+            obj, option=orjson.OPT_SORT_KEYS, default=str
+        ).decode()
+except ImportError:
+    def _json_default(obj):
+        # Match orjson's native RFC 3339 datetime output so both code
+        # paths serialize the manifest identically
+        if isinstance(obj, datetime):
+            return obj.isoformat()
+        return str(obj)
+
+    def _dumps_bytes(obj) -> bytes:
+        return json.dumps(obj, default=_json_default).encode()
+
+    def _dumps_sorted(obj) -> str:
+        return json.dumps(obj, sort_keys=True, default=_json_default)
+
 from open_skills.core.telemetry import logger
 from open_skills.core.library import get_config
 from open_skills.db.models import SkillVersion, Skill, User
 
+# Manifest cache keyed on the query filters, guarded by a cheap
+# fingerprint (max created_at, row count, published count) so the full
+# join + serialization only reruns when the version table actually
+# changed. Explicitly cleared on register/publish/unpublish.
+_MANIFEST_CACHE: Dict[tuple, tuple] = {}
+
+# Serialized manifests, keyed like _MANIFEST_CACHE and tied to the cached
+# dict by identity, so cache hits skip the encode as well as the build.
+_MANIFEST_BYTES: Dict[tuple, tuple] = {}
+
+
+def invalidate_manifest_cache() -> None:
+    """Drop cached manifests (call when versions are added or publish state flips)."""
+    _MANIFEST_CACHE.clear()
+    _MANIFEST_BYTES.clear()
+
+
+async def _version_table_fingerprint(db: AsyncSession) -> tuple:
+    """One-row aggregate that changes whenever skill versions change."""
+    result = await db.execute(
+        select(
+            func.max(SkillVersion.created_at),
+            func.count(SkillVersion.id),
+            func.count(SkillVersion.id).filter(
+                SkillVersion.is_published == True  # noqa: E712
+            ),
+        )
+    )
+    return tuple(result.one())
+
 
 async def manifest_json(
     db: Optional[AsyncSession] = None,
@@ -46,7 +107,7 @@ async def manifest_json(
     # Get or create DB session
     if db is None:
         config = get_config()
-        async for session in config.get_db():
+        async with config.session() as session:
             return await manifest_json(
                 db=session,
                 user_id=user_id,
@@ -54,73 +115,92 @@ async def manifest_json(
                 published_only=published_only,
             )
 
-    tools = await as_agent_tools(
-        db=db,
-        user_id=user_id,
-        org_id=org_id,
-        published_only=published_only,
-    )
+    cache_key = (user_id, org_id, published_only)
+    fingerprint = await _version_table_fingerprint(db)
 
-    return {
+    cached = _MANIFEST_CACHE.get(cache_key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+
+    # db is resolved at this point; call the shared builder directly
+    # instead of re-entering as_agent_tools' session dance
+    tools = await _build_tools(db, user_id, org_id, published_only, "versioned")
+
+    manifest = {
         "version": "2025-10-01",
         "provider": "open-skills",
+        # isoformat here: the dict is a public return value, and library
+        # consumers json.dumps it themselves — a raw datetime would make
+        # it non-serializable without orjson
         "generated_at": datetime.now(timezone.utc).isoformat(),
         "tools": tools,
     }
+    _MANIFEST_CACHE[cache_key] = (fingerprint, manifest)
+    return manifest
 
 
-async def as_agent_tools(
+async def manifest_bytes(
     db: Optional[AsyncSession] = None,
     user_id: Optional[UUID] = None,
     org_id: Optional[UUID] = None,
     published_only: bool = True,
-    name_format: str = "versioned",  # "versioned" or "simple"
-) -> List[Dict[str, Any]]:
+) -> bytes:
     """
-    Convert skill versions to agent tool definitions.
+    Serialized .well-known/skills.json manifest as JSON bytes.
+
+    Skips the per-request json.dumps FastAPI would otherwise run on the
+    manifest dict; serve via
+    `Response(content=..., media_type="application/json")`.
 
     Args:
         db: Database session (uses library config if None)
         user_id: Filter by user access
         org_id: Filter by organization access
         published_only: Only include published versions
-        name_format: Tool naming format:
-            - "versioned": skill:name@version (e.g., "skill:excel_to_pptx@1.0.0")
-            - "simple": skill:name (e.g., "skill:excel_to_pptx")
 
     Returns:
-        List of tool definitions compatible with most LLM frameworks
+        Manifest encoded as JSON bytes
+    """
+    manifest = await manifest_json(
+        db=db,
+        user_id=user_id,
+        org_id=org_id,
+        published_only=published_only,
+    )
 
-    Example:
-        ```python
-        # Get tools for agent registration
-        tools = await as_agent_tools(published_only=True)
+    cache_key = (user_id, org_id, published_only)
+    cached = _MANIFEST_BYTES.get(cache_key)
+    if cached is not None and cached[0] is manifest:
+        return cached[1]
 
-        # Register with your agent framework
-        for tool in tools:
-            agent.register_tool(
-                name=tool["name"],
-                description=tool["description"],
-                args_schema=tool["args_schema"],
-            )
-        ```
+    body = _dumps_bytes(manifest)
+    _MANIFEST_BYTES[cache_key] = (manifest, body)
+    return body
+
+
+def _tools_query(
+    user_id: Optional[UUID],
+    org_id: Optional[UUID],
+    published_only: bool,
+    name_format: str,
+):
     """
-    # Get or create DB session
-    if db is None:
-        config = get_config()
-        async for session in config.get_db():
-            return await as_agent_tools(
-                db=session,
-                user_id=user_id,
-                org_id=org_id,
-                published_only=published_only,
-                name_format=name_format,
-            )
+    Build the tool-manifest SELECT shared by as_agent_tools and
+    iter_agent_tools.
 
-    # Build query
-    query = select(SkillVersion, Skill).join(
-        Skill, SkillVersion.skill_id == Skill.id
-    )
+    Selects only the columns the tool dicts need, so rows come back as
+    lightweight mappings instead of hydrated ORM objects (no identity-map
+    entries, fewer bytes fetched).
+    """
+    query = select(
+        SkillVersion.id,
+        SkillVersion.version,
+        SkillVersion.description,
+        SkillVersion.metadata_yaml,
+        Skill.id.label("skill_id"),
+        Skill.name,
+        Skill.visibility,
+    ).join(Skill, SkillVersion.skill_id == Skill.id)
 
     # Filter by published status
     if published_only:
@@ -142,80 +222,100 @@ async def as_agent_tools(
             from sqlalchemy import or_
             query = query.where(or_(*conditions))
 
-    # Order by skill name and version (descending)
-    query = query.order_by(Skill.name, SkillVersion.created_at.desc())
+    # Order by skill name and version (descending). In simple-name mode
+    # let Postgres drop the duplicate skills (DISTINCT ON keeps the first
+    # row per name, i.e. the newest version) instead of filtering rows in
+    # Python after fetching them.
+    if name_format == "simple":
+        query = query.distinct(Skill.name)
+    return query.order_by(Skill.name, SkillVersion.created_at.desc())
 
-    result = await db.execute(query)
-    rows = result.all()
 
-    # Convert to tool definitions
-    tools = []
-    seen_skills = set()  # Track skills if using simple names
-
-    for skill_version, skill in rows:
-        metadata = skill_version.metadata_yaml or {}
-
-        # Skip if we've already included this skill (simple name mode)
-        if name_format == "simple" and skill.name in seen_skills:
-            continue
-
-        # Build tool name
-        if name_format == "versioned":
-            tool_name = f"skill:{skill.name}@{skill_version.version}"
-        else:
-            tool_name = f"skill:{skill.name}"
-            seen_skills.add(skill.name)
+def _build_tool(row, simple: bool) -> Dict[str, Any]:
+    """
+    Build one tool definition from a manifest query row mapping.
 
-        # Build args schema from metadata inputs
-        properties = {}
-        required = []
+    Deliberately pure Python: manifest builds are fingerprint-cached, so
+    this loop runs once per catalog change, not per request. Revisit
+    (e.g. a compiled extension) only if profiling shows conversion
+    dominating rebuilds at ~10k+ published versions.
+    """
+    metadata = row["metadata_yaml"] or {}
+    # Hoist the method lookups done per input into locals — this runs once
+    # per row on manifests that can hold thousands of tools
+    meta_get = metadata.get
+    type_map_get = _TYPE_MAP.get
+    skill_name = row["name"]
+    version = row["version"]
+    version_id_str = str(row["id"])
+
+    tool_name = (
+        f"skill:{skill_name}" if simple else f"skill:{skill_name}@{version}"
+    )
 
-        # Always include skill_version_id (hidden from LLM but needed for execution)
-        properties["skill_version_id"] = {
+    # skill_version_id is always present (hidden from LLM but needed for
+    # execution); one pass over inputs fills properties and required together
+    properties: Dict[str, Any] = {
+        "skill_version_id": {
             "type": "string",
             "description": "Internal: skill version ID",
-            "const": str(skill_version.id),
+            "const": version_id_str,
         }
-
-        # Add inputs from metadata
-        for input_spec in metadata.get("inputs", []):
-            input_name = input_spec.get("name", input_spec.get("type", "input"))
-            input_type = input_spec.get("type", "string")
-
-            # Map skill types to JSON schema types
-            json_type = _map_skill_type_to_json(input_type)
-
-            properties[input_name] = {
-                "type": json_type,
-                "description": input_spec.get("description", f"{input_name} input"),
-            }
-
-            # Add to required if not optional
-            if not input_spec.get("optional", False):
-                required.append(input_name)
-
-        # Build tool definition
-        tool = {
-            "name": tool_name,
-            "title": metadata.get("name", skill.name).replace("_", " ").title(),
-            "description": skill_version.description or metadata.get("description", ""),
-            "args_schema": {
-                "type": "object",
-                "properties": properties,
-                "required": required,
-            },
-            "io": {
-                "inputs": metadata.get("inputs", []),
-                "outputs": metadata.get("outputs", []),
-            },
-            "skill_version_id": str(skill_version.id),
-            "skill_id": str(skill.id),
-            "version": skill_version.version,
-            "visibility": skill.visibility,
-            "tags": metadata.get("tags", []),
+    }
+    required: List[str] = []
+    inputs = meta_get("inputs", [])
+    for input_spec in inputs:
+        spec_get = input_spec.get
+        input_name = spec_get("name", spec_get("type", "input"))
+        input_type = spec_get("type", "string")
+        properties[input_name] = {
+            # Direct hit on the pre-populated map first, .lower() only for
+            # odd casings
+            "type": type_map_get(input_type)
+            or type_map_get(input_type.lower(), "string"),
+            "description": spec_get("description", f"{input_name} input"),
         }
+        if not spec_get("optional", False):
+            required.append(input_name)
+
+    return {
+        "name": tool_name,
+        "title": meta_get("name", skill_name).replace("_", " ").title(),
+        "description": row["description"] or meta_get("description", ""),
+        "args_schema": {
+            "type": "object",
+            "properties": properties,
+            "required": required,
+        },
+        "io": {
+            "inputs": inputs,
+            "outputs": meta_get("outputs", []),
+        },
+        "skill_version_id": version_id_str,
+        "skill_id": str(row["skill_id"]),
+        "version": version,
+        "visibility": row["visibility"],
+        "tags": meta_get("tags", []),
+    }
 
-        tools.append(tool)
+
+async def _build_tools(
+    db: AsyncSession,
+    user_id: Optional[UUID],
+    org_id: Optional[UUID],
+    published_only: bool,
+    name_format: str,
+) -> List[Dict[str, Any]]:
+    """Fetch and convert tool definitions using an already-resolved session."""
+    query = _tools_query(user_id, org_id, published_only, name_format)
+    result = await db.execute(query)
+    rows = result.mappings().all()
+
+    # Convert to tool definitions. DISTINCT ON already deduped skills in
+    # simple mode, so this is a straight comprehension — no append/seen-set
+    # bookkeeping per row in the interpreter.
+    simple = name_format == "simple"
+    tools = [_build_tool(row, simple) for row in rows]
 
     logger.info(
         "agent_tools_generated",
@@ -227,18 +327,211 @@ async def as_agent_tools(
     return tools
 
 
+async def as_agent_tools(
+    db: Optional[AsyncSession] = None,
+    user_id: Optional[UUID] = None,
+    org_id: Optional[UUID] = None,
+    published_only: bool = True,
+    name_format: str = "versioned",  # "versioned" or "simple"
+) -> List[Dict[str, Any]]:
+    """
+    Convert skill versions to agent tool definitions.
+
+    Args:
+        db: Database session (uses library config if None)
+        user_id: Filter by user access
+        org_id: Filter by organization access
+        published_only: Only include published versions
+        name_format: Tool naming format:
+            - "versioned": skill:name@version (e.g., "skill:excel_to_pptx@1.0.0")
+            - "simple": skill:name (e.g., "skill:excel_to_pptx")
+
+    Returns:
+        List of tool definitions compatible with most LLM frameworks
+
+    Example:
+        ```python
+        # Get tools for agent registration
+        tools = await as_agent_tools(published_only=True)
+
+        # Register with your agent framework
+        for tool in tools:
+            agent.register_tool(
+                name=tool["name"],
+                description=tool["description"],
+                args_schema=tool["args_schema"],
+            )
+        ```
+    """
+    if db is None:
+        # Coalesce concurrent library-mode callers with the same filters
+        # (prompt render + session metadata gathered together, parallel
+        # requests) onto one session and one query.
+        key = (user_id, org_id, published_only, name_format)
+        task = _INFLIGHT_TOOLS.get(key)
+        if task is None:
+            task = asyncio.ensure_future(
+                _fetch_tools(user_id, org_id, published_only, name_format)
+            )
+            _INFLIGHT_TOOLS[key] = task
+            task.add_done_callback(
+                lambda _t, _k=key: _INFLIGHT_TOOLS.pop(_k, None)
+            )
+        return await task
+
+    return await _build_tools(db, user_id, org_id, published_only, name_format)
+
+
+# In-flight library-mode tool fetches, keyed on query filters. Entries
+# remove themselves when the task finishes; awaiters hold the task ref.
+_INFLIGHT_TOOLS: Dict[tuple, "asyncio.Task"] = {}
+
+
+async def _fetch_tools(
+    user_id: Optional[UUID],
+    org_id: Optional[UUID],
+    published_only: bool,
+    name_format: str,
+) -> List[Dict[str, Any]]:
+    """Open a library-config session and build the tool list."""
+    config = get_config()
+    async with config.session() as session:
+        return await _build_tools(
+            session, user_id, org_id, published_only, name_format
+        )
+
+
+async def iter_agent_tools(
+    db: Optional[AsyncSession] = None,
+    user_id: Optional[UUID] = None,
+    org_id: Optional[UUID] = None,
+    published_only: bool = True,
+    name_format: str = "versioned",
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Yield agent tool definitions one at a time.
+
+    Streaming variant of as_agent_tools: rows come off a server-side
+    cursor (db.stream) and are converted as they arrive, so memory stays
+    flat regardless of how many versions a tenant has published.
+
+    Args:
+        db: Database session (uses library config if None)
+        user_id: Filter by user access
+        org_id: Filter by organization access
+        published_only: Only include published versions
+        name_format: Tool naming format ("versioned" or "simple")
+
+    Yields:
+        Tool definition dicts, one per skill version
+    """
+    if db is None:
+        config = get_config()
+        async with config.session() as session:
+            async for tool in iter_agent_tools(
+                db=session,
+                user_id=user_id,
+                org_id=org_id,
+                published_only=published_only,
+                name_format=name_format,
+            ):
+                yield tool
+            return
+
+    query = _tools_query(user_id, org_id, published_only, name_format)
+    simple = name_format == "simple"
+
+    result = await db.stream(query)
+    async for row in result.mappings():
+        yield _build_tool(row, simple)
+
+
+async def manifest_stream(
+    db: Optional[AsyncSession] = None,
+    user_id: Optional[UUID] = None,
+    org_id: Optional[UUID] = None,
+    published_only: bool = True,
+) -> AsyncIterator[bytes]:
+    """
+    Stream the .well-known/skills.json manifest as JSON byte chunks.
+
+    Emits the same document as manifest_bytes but tool by tool, for
+    serving huge manifests with constant memory:
+
+    Example:
+        ```python
+        @app.get("/.well-known/skills.json")
+        async def skills_manifest():
+            return StreamingResponse(
+                manifest_stream(), media_type="application/json"
+            )
+        ```
+
+    Yields:
+        JSON byte chunks forming one complete manifest document
+    """
+    head = {
+        "version": "2025-10-01",
+        "provider": "open-skills",
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+    }
+    # Reopen the serialized header as '{...,"tools":[' so tools append
+    # inside the same object
+    yield _dumps_bytes(head)[:-1] + b',"tools":['
+
+    first = True
+    async for tool in iter_agent_tools(
+        db=db,
+        user_id=user_id,
+        org_id=org_id,
+        published_only=published_only,
+    ):
+        if first:
+            first = False
+        else:
+            yield b","
+        yield _dumps_bytes(tool)
+
+    yield b"]}"
+
+
+# Skill input/output type -> JSON schema type, built once at import with
+# upper/title-case spellings pre-populated so the hot path usually skips
+# the .lower() allocation entirely.
+_TYPE_MAP = {
+    variant: json_type
+    for base, json_type in [
+        ("text", "string"),
+        ("number", "number"),
+        ("integer", "integer"),
+        ("boolean", "boolean"),
+        ("file", "string"),  # URL or path
+        ("object", "object"),
+        ("array", "array"),
+    ]
+    for variant in (base, base.upper(), base.title())
+}
+
+
 def _map_skill_type_to_json(skill_type: str) -> str:
     """Map skill input/output types to JSON schema types."""
-    type_map = {
-        "text": "string",
-        "number": "number",
-        "integer": "integer",
-        "boolean": "boolean",
-        "file": "string",  # URL or path
-        "object": "object",
-        "array": "array",
-    }
-    return type_map.get(skill_type.lower(), "string")
+    return _TYPE_MAP.get(skill_type) or _TYPE_MAP.get(skill_type.lower(), "string")
+
+
+# Converted schemas are memoized per (skill_version_id, tool name): the
+# shape of a tool is fixed for a given version, so repeated conversions in
+# list comprehensions become dict lookups after warmup.
+_openai_function_cache: Dict[tuple, Dict[str, Any]] = {}
+_openai_tool_cache: Dict[tuple, Dict[str, Any]] = {}
+_anthropic_tool_cache: Dict[tuple, Dict[str, Any]] = {}
+
+
+def _conversion_key(tool: Dict[str, Any]) -> Optional[tuple]:
+    """Cache key for schema conversion, or None if the tool is anonymous."""
+    version_id = tool.get("skill_version_id")
+    if version_id is None:
+        return None
+    return (version_id, tool["name"])
 
 
 def to_openai_function(tool: Dict[str, Any]) -> Dict[str, Any]:
@@ -266,12 +559,22 @@ def to_openai_function(tool: Dict[str, Any]) -> Dict[str, Any]:
         )
         ```
     """
-    return {
+    key = _conversion_key(tool)
+    if key is not None:
+        cached = _openai_function_cache.get(key)
+        if cached is not None:
+            return cached
+
+    converted = {
         "name": tool["name"],
         "description": tool["description"],
         "parameters": tool["args_schema"],
     }
 
+    if key is not None:
+        _openai_function_cache[key] = converted
+    return converted
+
 
 def to_openai_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -310,7 +613,13 @@ def to_openai_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
                 # Execute the skill...
         ```
     """
-    return {
+    key = _conversion_key(tool)
+    if key is not None:
+        cached = _openai_tool_cache.get(key)
+        if cached is not None:
+            return cached
+
+    converted = {
         "type": "function",
         "function": {
             "name": tool["name"],
@@ -319,6 +628,10 @@ def to_openai_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
         }
     }
 
+    if key is not None:
+        _openai_tool_cache[key] = converted
+    return converted
+
 
 def to_anthropic_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
     """
@@ -343,12 +656,82 @@ def to_anthropic_tool(tool: Dict[str, Any]) -> Dict[str, Any]:
         )
         ```
     """
-    return {
+    key = _conversion_key(tool)
+    if key is not None:
+        cached = _anthropic_tool_cache.get(key)
+        if cached is not None:
+            return cached
+
+    converted = {
         "name": tool["name"],
         "description": tool["description"],
         "input_schema": tool["args_schema"],
     }
 
+    if key is not None:
+        _anthropic_tool_cache[key] = converted
+    return converted
+
+
+# langchain imports resolved once on first use and cached, so repeated
+# to_langchain_tool calls skip the import machinery while plain module
+# import stays langchain-free.
+_LANGCHAIN: Optional[tuple] = None
+
+
+def _langchain_imports() -> tuple:
+    """Return (StructuredTool, create_model), importing them on first call."""
+    global _LANGCHAIN
+    if _LANGCHAIN is None:
+        try:
+            from langchain.tools import StructuredTool
+            from pydantic import create_model
+        except ImportError:
+            raise RuntimeError(
+                "langchain package required. Install with: pip install langchain"
+            )
+        _LANGCHAIN = (StructuredTool, create_model)
+    return _LANGCHAIN
+
+
+# JSON schema type -> Python type for pydantic field construction
+_JSON_TO_PY = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "array": list,
+}
+
+
+@lru_cache(maxsize=1024)
+def _args_model_for(name: str, schema_json: str):
+    """
+    Build (and memoize) the pydantic args model for a tool schema.
+
+    Keyed on the tool name plus a key-sorted serialization of its
+    args_schema, so identical schemas reuse one model instead of paying
+    pydantic's create_model cost per conversion. Field types mirror the
+    JSON schema types; optional inputs default to None.
+    """
+    _, create_model = _langchain_imports()
+    schema = json.loads(schema_json)
+    required = set(schema.get("required", []))
+    # skill_version_id rides along in properties (not in required) but
+    # the executor can't run without it
+    required.add("skill_version_id")
+
+    fields = {}
+    for prop_name, spec in schema.get("properties", {}).items():
+        py_type = _JSON_TO_PY.get(spec.get("type", "string"), str)
+        if prop_name in required:
+            fields[prop_name] = (py_type, ...)
+        else:
+            fields[prop_name] = (Optional[py_type], None)
+
+    return create_model(f"{name}_Args", **fields)
+
 
 def to_langchain_tool(tool: Dict[str, Any]):
     """
@@ -374,20 +757,11 @@ def to_langchain_tool(tool: Dict[str, Any]):
     Note:
         Requires langchain package: pip install langchain
     """
-    try:
-        from langchain.tools import StructuredTool
-        from pydantic import BaseModel, create_model
-    except ImportError:
-        raise RuntimeError(
-            "langchain package required. Install with: pip install langchain"
-        )
-
-    # Create Pydantic model from args schema
-    fields = {}
-    for prop_name, prop_spec in tool["args_schema"]["properties"].items():
-        fields[prop_name] = (str, ...)  # Simplified - all strings for now
+    StructuredTool, _ = _langchain_imports()
 
-    ArgsModel = create_model(f"{tool['name']}_Args", **fields)
+    # Create Pydantic model from args schema (memoized — create_model is
+    # tens of ms per call, and tool schemas are stable per version)
+    ArgsModel = _args_model_for(tool["name"], _dumps_sorted(tool["args_schema"]))
 
     # Create callable (will be implemented by executor integration)
     async def _run(**kwargs):
@@ -398,7 +772,7 @@ def to_langchain_tool(tool: Dict[str, Any]):
         version_id = UUID(kwargs.get("skill_version_id"))
 
         config = get_config()
-        async for db in config.get_db():
+        async with config.session() as db:
             manager = SkillManager(db)
             executor = SkillExecutor(db)
 
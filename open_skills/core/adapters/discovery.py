@@ -2,12 +2,14 @@
 Skill discovery and auto-registration from folder conventions.
 """
 
+import asyncio
 import re
 from pathlib import Path
 from typing import Optional, List
 from uuid import UUID
 
 from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from open_skills.core.packing import parse_skill_bundle, SkillValidationError
@@ -26,6 +28,7 @@ async def register_skills_from_folder(
     visibility: str = "org",
     auto_publish: bool = False,
     auto_create_skills: bool = True,
+    only_dirs: Optional[set] = None,
 ) -> List[SkillVersion]:
     """
     Discover and register all skill bundles in a folder.
@@ -40,6 +43,9 @@ async def register_skills_from_folder(
         visibility: Default visibility ('user' or 'org')
         auto_publish: Auto-publish new versions
         auto_create_skills: Auto-create skill records if they don't exist
+        only_dirs: Optional set of bundle directories to restrict
+            registration to (used by watch_skills_folder for incremental
+            re-registration)
 
     Returns:
         List of created/updated SkillVersion instances
@@ -68,7 +74,7 @@ async def register_skills_from_folder(
             raise RuntimeError(
                 "Library not configured. Call configure() first or pass db session"
             )
-        async for session in config.get_db():
+        async with config.session() as session:
             return await register_skills_from_folder(
                 folder,
                 db=session,
@@ -77,6 +83,7 @@ async def register_skills_from_folder(
                 visibility=visibility,
                 auto_publish=auto_publish,
                 auto_create_skills=auto_create_skills,
+                only_dirs=only_dirs,
             )
 
     with trace_operation("register_skills_from_folder", {"folder": str(folder)}):
@@ -89,9 +96,13 @@ async def register_skills_from_folder(
             owner_id = await _get_or_create_system_user(db)
 
         # Find all skill bundles (directories with SKILL.md)
+        if only_dirs is not None:
+            only_dirs = {Path(d).resolve() for d in only_dirs}
         skill_dirs = []
         for item in folder.iterdir():
             if item.is_dir() and (item / "SKILL.md").exists():
+                if only_dirs is not None and item.resolve() not in only_dirs:
+                    continue
                 skill_dirs.append(item)
 
         logger.info(
@@ -100,85 +111,121 @@ async def register_skills_from_folder(
             count=len(skill_dirs),
         )
 
-        # Register each skill bundle
-        for skill_dir in skill_dirs:
+        # Parse all bundles up front so DB work can be batched. Parsing is
+        # synchronous file IO (SKILL.md read + YAML), so run the parses
+        # concurrently on the default thread pool instead of serially.
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(
+            *[
+                loop.run_in_executor(None, parse_skill_bundle, skill_dir)
+                for skill_dir in skill_dirs
+            ],
+            return_exceptions=True,
+        )
+
+        parsed = []
+        for skill_dir, outcome in zip(skill_dirs, results):
+            if isinstance(outcome, SkillValidationError):
+                logger.error(
+                    "skill_validation_failed",
+                    directory=skill_dir.name,
+                    error=str(outcome),
+                )
+            elif isinstance(outcome, BaseException):
+                logger.error(
+                    "skill_parse_failed",
+                    directory=skill_dir.name,
+                    error=str(outcome),
+                )
+            else:
+                parsed.append((skill_dir, outcome))
+
+        # Bulk-load existing skills and their versions in two round-trips
+        # instead of two SELECTs per bundle
+        skills_by_name = {}
+        versions_by_key = {}
+        names = [bundle.metadata["name"] for _, bundle in parsed]
+        if names:
+            result = await db.execute(select(Skill).where(Skill.name.in_(names)))
+            skills_by_name = {s.name: s for s in result.scalars()}
+        if skills_by_name:
+            result = await db.execute(
+                select(SkillVersion).where(
+                    SkillVersion.skill_id.in_(
+                        [s.id for s in skills_by_name.values()]
+                    )
+                )
+            )
+            versions_by_key = {
+                (v.skill_id, v.version): v for v in result.scalars()
+            }
+
+        # Register each skill bundle (existence checks are now dict lookups)
+        new_versions = []
+        for skill_dir, bundle in parsed:
             try:
-                # Parse bundle
-                bundle = parse_skill_bundle(skill_dir)
                 skill_name = bundle.metadata["name"]
                 version_string = bundle.metadata["version"]
 
-                # Find or create skill record
-                skill = await _get_or_create_skill(
-                    db,
-                    manager,
-                    skill_name,
-                    owner_id,
-                    org_id,
-                    visibility,
-                    auto_create=auto_create_skills,
-                )
-
+                skill = skills_by_name.get(skill_name)
                 if skill is None:
-                    logger.warning(
-                        "skill_not_found_skipping",
+                    if not auto_create_skills:
+                        logger.warning(
+                            "skill_not_found_skipping",
+                            name=skill_name,
+                            auto_create=auto_create_skills,
+                        )
+                        continue
+
+                    skill = await manager.create_skill(
+                        name=skill_name,
+                        owner_id=owner_id,
+                        org_id=org_id,
+                        visibility=visibility,
+                    )
+                    await db.flush()
+                    skills_by_name[skill_name] = skill
+                    logger.info(
+                        "skill_auto_created",
+                        skill_id=str(skill.id),
                         name=skill_name,
-                        auto_create=auto_create_skills,
                     )
-                    continue
-
-                # Check if version already exists
-                existing_version = await manager.get_skill_version_by_number(
-                    skill.id, version_string
-                )
 
+                existing_version = versions_by_key.get((skill.id, version_string))
                 if existing_version:
                     # Version exists - check if we should update
-                    version_id = existing_version.id
                     logger.info(
                         "skill_version_exists",
                         skill_id=str(skill.id),
                         version=version_string,
-                        version_id=str(version_id),
+                        version_id=str(existing_version.id),
                     )
                     # Could optionally update metadata/embedding here
                     registered_versions.append(existing_version)
-                else:
-                    # Create new version
-                    version = await manager.create_version_from_bundle(
-                        skill.id,
-                        skill_dir,
-                    )
-
-                    # Generate embedding
-                    await router.embed_skill_version(version)
-
-                    # Auto-publish if requested
-                    if auto_publish or bundle.metadata.get("published", False):
-                        version.is_published = True
-                        await db.flush()
+                    continue
 
-                    await db.commit()
-                    await db.refresh(version)
+                # Create new version (embedded in a batch below)
+                version = await manager.create_version_from_bundle(
+                    skill.id,
+                    skill_dir,
+                )
 
-                    registered_versions.append(version)
+                # Auto-publish if requested
+                if auto_publish or bundle.metadata.get("published", False):
+                    version.is_published = True
 
-                    logger.info(
-                        "skill_version_registered",
-                        skill_id=str(skill.id),
-                        skill_name=skill_name,
-                        version=version_string,
-                        version_id=str(version.id),
-                        published=version.is_published,
-                    )
+                new_versions.append(version)
+                registered_versions.append(version)
 
-            except SkillValidationError as e:
-                logger.error(
-                    "skill_validation_failed",
-                    directory=skill_dir.name,
-                    error=str(e),
+                logger.info(
+                    "skill_version_registered",
+                    skill_id=str(skill.id),
+                    skill_name=skill_name,
+                    version=version_string,
+                    version_id=str(version.id),
+                    published=version.is_published,
                 )
-                continue
+
             except Exception as e:
                 logger.exception(
                     "skill_registration_failed",
@@ -187,72 +234,90 @@ async def register_skills_from_folder(
                 )
                 continue
 
+        # Generate embeddings for the new versions concurrently. Only the
+        # HTTP calls overlap (bounded so the provider isn't hammered); the
+        # shared session is written serially once they all return.
+        if new_versions:
+            sem = asyncio.Semaphore(8)
+
+            async def _embed(version):
+                async with sem:
+                    return await router.generate_embedding(
+                        router.embedding_text(version)
+                    )
+
+            embeddings = await asyncio.gather(
+                *[_embed(v) for v in new_versions],
+                return_exceptions=True,
+            )
+            for version, embedding in zip(new_versions, embeddings):
+                if isinstance(embedding, BaseException):
+                    logger.error(
+                        "skill_embedding_failed",
+                        version_id=str(version.id),
+                        error=str(embedding),
+                    )
+                else:
+                    version.embedding = embedding
+
+        # One commit for the whole batch instead of one per bundle.
+        # No refresh afterwards: the session factories run with
+        # expire_on_commit=False and every column (id, created_at,
+        # is_published) is populated client-side, so a post-commit SELECT
+        # per version would reload nothing new.
+        if new_versions:
+            await db.commit()
+
         logger.info(
             "skill_registration_complete",
             folder=str(folder),
             total_registered=len(registered_versions),
         )
 
+        # The manifest changed; drop cached rendered prompts and metadata
+        from open_skills.core.adapters.agent_tool_api import invalidate_manifest_cache
+        from open_skills.core.adapters.prompt_injection import (
+            invalidate_prompt_cache,
+            invalidate_session_metadata_cache,
+        )
+        invalidate_manifest_cache()
+        invalidate_prompt_cache()
+        invalidate_session_metadata_cache()
+
         return registered_versions
 
 
 async def _get_or_create_system_user(db: AsyncSession) -> UUID:
-    """Get or create a system user for skill ownership."""
-    result = await db.execute(
-        select(User).where(User.email == "system@open-skills.local")
-    )
-    user = result.scalar_one_or_none()
-
-    if not user:
-        user = User(email="system@open-skills.local")
-        db.add(user)
-        await db.flush()
-        await db.refresh(user)
-        logger.info("system_user_created", user_id=str(user.id))
-
-    return user.id
-
-
-async def _get_or_create_skill(
-    db: AsyncSession,
-    manager: SkillManager,
-    name: str,
-    owner_id: UUID,
-    org_id: Optional[UUID],
-    visibility: str,
-    auto_create: bool = True,
-) -> Optional[Skill]:
-    """Get or create a skill record by name."""
-    # Try to find existing skill by name
-    result = await db.execute(
-        select(Skill).where(Skill.name == name)
-    )
-    skill = result.scalar_one_or_none()
-
-    if skill:
-        return skill
-
-    if not auto_create:
-        return None
+    """
+    Get or create a system user for skill ownership.
 
-    # Create new skill
-    skill = await manager.create_skill(
-        name=name,
-        owner_id=owner_id,
-        org_id=org_id,
-        visibility=visibility,
+    Uses a single upsert round-trip (ON CONFLICT on the email unique
+    constraint) so concurrent worker startups can't race a SELECT-then-
+    INSERT window.
+    """
+    stmt = (
+        pg_insert(User)
+        .values(email="system@open-skills.local")
+        .on_conflict_do_update(
+            index_elements=["email"],
+            # No-op update so RETURNING yields the row on conflict too
+            set_={"email": "system@open-skills.local"},
+        )
+        .returning(User.id)
     )
+    user_id = (await db.execute(stmt)).scalar_one()
+    return user_id
 
-    await db.flush()
-    await db.refresh(skill)
 
-    logger.info(
-        "skill_auto_created",
-        skill_id=str(skill.id),
-        name=name,
-    )
-
-    return skill
+def _resolve_bundle_root(path: Path, folder: Path) -> Optional[Path]:
+    """Map a changed file path to its top-level bundle directory, if any."""
+    try:
+        relative = path.resolve().relative_to(folder)
+    except ValueError:
+        return None
+    if not relative.parts:
+        return None
+    return folder / relative.parts[0]
 
 
 async def watch_skills_folder(
@@ -295,15 +360,32 @@ async def watch_skills_folder(
             "Install with: pip install watchfiles"
         )
 
-    folder = Path(folder_path)
+    folder = Path(folder_path).resolve()
     logger.info("watching_skills_folder", folder=str(folder))
 
-    async for changes in awatch(folder):
-        logger.info("skills_folder_changed", changes=len(changes))
+    # step=200 makes awatch hold each batch open until the folder has been
+    # quiet for 200ms, coalescing editor save-storms into one registration
+    async for changes in awatch(folder, step=200):
+        # Re-register only the bundles the changed paths fall under instead
+        # of rescanning the whole tree on every keystroke
+        affected = {
+            bundle_root
+            for _change, changed_path in changes
+            if (bundle_root := _resolve_bundle_root(Path(changed_path), folder))
+        }
+        if not affected:
+            continue
+
+        logger.info(
+            "skills_folder_changed",
+            changes=len(changes),
+            affected_bundles=len(affected),
+        )
 
         try:
             versions = await register_skills_from_folder(
                 folder,
+                only_dirs=affected,
                 **register_kwargs
             )
 
@@ -5,17 +5,79 @@ Provides functions to serialize skill manifests into formats suitable for
 injection into agent system prompts or structured tool parameters.
 """
 
+import time
+from itertools import chain
 from typing import Dict, Any, List, Optional
 from uuid import UUID
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from open_skills.core.adapters.agent_tool_api import as_agent_tools
+from open_skills.core.adapters.agent_tool_api import (
+    as_agent_tools,
+    to_anthropic_tool,
+    to_langchain_tool,
+    to_openai_tool,
+)
 from open_skills.core.library import get_config
 from open_skills.core.telemetry import get_logger
 
 logger = get_logger(__name__)
 
+# Rendered prompt cache: the manifest only changes when skills are
+# (re)registered or published, so rendered (text, tool_count) pairs are
+# reused across calls and refreshed via invalidate_prompt_cache().
+_prompt_cache: Dict[tuple, tuple] = {}
+
+
+def invalidate_prompt_cache() -> None:
+    """
+    Drop cached rendered prompts.
+
+    Called from skill registration; call manually after publish/unpublish
+    if you bypass the discovery helpers.
+    """
+    _prompt_cache.clear()
+
+
+def _format_prompt_entry(i: int, tool: Dict[str, Any]) -> str:
+    """Render one tool as a numbered multi-line block for "detailed" prompts."""
+    # `or ()` defaults: no fresh empty list allocated per tool
+    io = tool.get("io") or {}
+    parts = [
+        f"{i}. **{tool['name']}**",
+        f"   Description: {tool['description']}",
+    ]
+
+    inputs = io.get("inputs") or ()
+    if inputs:
+        parts.append(
+            "   Inputs: "
+            + ", ".join(
+                f"{inp.get('name', inp.get('type', 'input'))}"
+                f" ({inp.get('type', 'any')})"
+                + (f": {desc}" if (desc := inp.get("description", "")) else "")
+                for inp in inputs
+            )
+        )
+
+    outputs = io.get("outputs") or ()
+    if outputs:
+        parts.append(
+            "   Outputs: "
+            + ", ".join(
+                f"{out.get('name', out.get('type', 'output'))}"
+                f" ({out.get('type', 'any')})"
+                for out in outputs
+            )
+        )
+
+    tags = tool.get("tags") or ()
+    if tags:
+        parts.append(f"   Tags: {', '.join(tags)}")
+
+    parts.append("")  # Blank line between skills
+    return "\n".join(parts)
+
 
 async def manifest_to_prompt(
     db: Optional[AsyncSession] = None,
@@ -63,6 +125,34 @@ async def manifest_to_prompt(
         '''
         ```
     """
+    text, _count = await _render_prompt(
+        db=db,
+        user_id=user_id,
+        org_id=org_id,
+        published_only=published_only,
+        format=format,
+    )
+    return text
+
+
+async def _render_prompt(
+    db: Optional[AsyncSession],
+    user_id: Optional[UUID],
+    org_id: Optional[UUID],
+    published_only: bool,
+    format: str,
+) -> tuple:
+    """
+    Render the skills prompt and return (text, tool_count).
+
+    Internal counterpart of manifest_to_prompt that also reports the tool
+    count, so callers logging it don't re-scan the rendered text.
+    """
+    cache_key = (format, user_id, org_id, published_only)
+    cached = _prompt_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     # Get tools
     tools = await as_agent_tools(
         db=db,
@@ -73,59 +163,26 @@ async def manifest_to_prompt(
     )
 
     if not tools:
-        return "No skills are currently available."
+        # Not cached so newly registered skills show up immediately
+        return ("No skills are currently available.", 0)
 
-    # Format based on style
+    # Format based on style — each branch feeds a generator straight into
+    # "\n".join, skipping the per-line list append churn
     if format == "compact":
-        lines = []
-        for tool in tools:
-            lines.append(f"• **{tool['name']}** — {tool['description']}")
-        result = "\n".join(lines)
+        result = "\n".join(
+            f"• **{tool['name']}** — {tool['description']}" for tool in tools
+        )
 
     elif format == "numbered":
-        lines = []
-        for i, tool in enumerate(tools, 1):
-            lines.append(f"{i}. **{tool['name']}** — {tool['description']}")
-        result = "\n".join(lines)
+        result = "\n".join(
+            f"{i}. **{tool['name']}** — {tool['description']}"
+            for i, tool in enumerate(tools, 1)
+        )
 
     else:  # detailed
-        lines = []
-        for i, tool in enumerate(tools, 1):
-            lines.append(f"{i}. **{tool['name']}**")
-            lines.append(f"   Description: {tool['description']}")
-
-            # Extract inputs
-            inputs = tool.get("io", {}).get("inputs", [])
-            if inputs:
-                input_strs = []
-                for inp in inputs:
-                    inp_name = inp.get("name", inp.get("type", "input"))
-                    inp_type = inp.get("type", "any")
-                    inp_desc = inp.get("description", "")
-                    if inp_desc:
-                        input_strs.append(f"{inp_name} ({inp_type}): {inp_desc}")
-                    else:
-                        input_strs.append(f"{inp_name} ({inp_type})")
-                lines.append(f"   Inputs: {', '.join(input_strs)}")
-
-            # Extract outputs
-            outputs = tool.get("io", {}).get("outputs", [])
-            if outputs:
-                output_strs = []
-                for out in outputs:
-                    out_name = out.get("name", out.get("type", "output"))
-                    out_type = out.get("type", "any")
-                    output_strs.append(f"{out_name} ({out_type})")
-                lines.append(f"   Outputs: {', '.join(output_strs)}")
-
-            # Add tags if available
-            tags = tool.get("tags", [])
-            if tags:
-                lines.append(f"   Tags: {', '.join(tags)}")
-
-            lines.append("")  # Blank line between skills
-
-        result = "\n".join(lines)
+        result = "\n".join(
+            _format_prompt_entry(i, tool) for i, tool in enumerate(tools, 1)
+        )
 
     logger.info(
         "manifest_to_prompt_generated",
@@ -135,7 +192,9 @@ async def manifest_to_prompt(
         org_id=str(org_id) if org_id else None,
     )
 
-    return result
+    entry = (result, len(tools))
+    _prompt_cache[cache_key] = entry
+    return entry
 
 
 async def manifest_to_tools(
@@ -175,12 +234,6 @@ async def manifest_to_tools(
         )
         ```
     """
-    from open_skills.core.adapters.agent_tool_api import (
-        to_openai_tool,
-        to_anthropic_tool,
-        to_langchain_tool,
-    )
-
     # Get generic tools
     tools = await as_agent_tools(
         db=db,
@@ -189,17 +242,35 @@ async def manifest_to_tools(
         published_only=published_only,
     )
 
-    # Convert to framework-specific format
+    # Convert to framework-specific format. The converters are sync and
+    # memoized per skill version, so list(map(...)) keeps the loop at
+    # C level — after warmup this is len(tools) dict lookups.
     if framework == "openai":
-        return [to_openai_tool(t) for t in tools]
+        return list(map(to_openai_tool, tools))
     elif framework == "anthropic":
-        return [to_anthropic_tool(t) for t in tools]
+        return list(map(to_anthropic_tool, tools))
     elif framework == "langchain":
-        return [to_langchain_tool(t) for t in tools]
+        return list(map(to_langchain_tool, tools))
     else:
         return tools
 
 
+# Static template for inject_skills_context, built once at import so each
+# call interpolates the three dynamic values instead of re-assembling the
+# surrounding fragments
+_INJECT_TEMPLATE = """{system}
+
+## {title}
+
+You have access to the following skills:
+
+{ctx}
+
+When a task requires capabilities provided by these skills, use them by making tool calls.
+Always explain what you're doing and show results to the user.
+"""
+
+
 async def inject_skills_context(
     system_prompt: str,
     db: Optional[AsyncSession] = None,
@@ -240,7 +311,7 @@ async def inject_skills_context(
         agent = Agent(system_prompt=full_prompt)
         ```
     """
-    skills_context = await manifest_to_prompt(
+    skills_context, tool_count = await _render_prompt(
         db=db,
         user_id=user_id,
         org_id=org_id,
@@ -248,29 +319,23 @@ async def inject_skills_context(
         format=format,
     )
 
-    if skills_context == "No skills are currently available.":
+    if tool_count == 0:
         # Don't modify prompt if no skills
         logger.warning("inject_skills_context_no_skills")
         return system_prompt
 
     # Inject skills section
-    augmented_prompt = f"""{system_prompt}
-
-## {section_title}
-
-You have access to the following skills:
-
-{skills_context}
-
-When a task requires capabilities provided by these skills, use them by making tool calls.
-Always explain what you're doing and show results to the user.
-"""
+    augmented_prompt = _INJECT_TEMPLATE.format(
+        system=system_prompt,
+        title=section_title,
+        ctx=skills_context,
+    )
 
     logger.info(
         "inject_skills_context_success",
         original_length=len(system_prompt),
         augmented_length=len(augmented_prompt),
-        skills_added=skills_context.count("**"),  # Approximate skill count
+        skills_added=tool_count,
     )
 
     return augmented_prompt
@@ -309,8 +374,10 @@ def format_skill_detailed(tool: Dict[str, Any]) -> str:
     lines = [f"**{tool['name']}**"]
     lines.append(f"Description: {tool['description']}")
 
+    io = tool.get("io") or {}
+
     # Inputs
-    inputs = tool.get("io", {}).get("inputs", [])
+    inputs = io.get("inputs") or ()
     if inputs:
         input_strs = [
             f"{inp.get('name', inp.get('type'))} ({inp.get('type')})"
@@ -319,7 +386,7 @@ def format_skill_detailed(tool: Dict[str, Any]) -> str:
         lines.append(f"Inputs: {', '.join(input_strs)}")
 
     # Outputs
-    outputs = tool.get("io", {}).get("outputs", [])
+    outputs = io.get("outputs") or ()
     if outputs:
         output_strs = [
             f"{out.get('name', out.get('type'))} ({out.get('type')})"
@@ -330,6 +397,18 @@ def format_skill_detailed(tool: Dict[str, Any]) -> str:
     return "\n".join(lines)
 
 
+# Session metadata cache: aggregation over names/tags is effectively
+# immutable between publishes, and session startup is the highest-frequency
+# caller, so results are reused for a short TTL.
+_META_CACHE_TTL = 30.0
+_meta_cache: Dict[tuple, tuple] = {}
+
+
+def invalidate_session_metadata_cache() -> None:
+    """Drop cached session metadata (called on registration/publish)."""
+    _meta_cache.clear()
+
+
 async def get_skills_session_metadata(
     db: Optional[AsyncSession] = None,
     user_id: Optional[UUID] = None,
@@ -358,6 +437,12 @@ async def get_skills_session_metadata(
         # Logs: skill_count=5, skill_names=["skill1", "skill2", ...]
         ```
     """
+    cache_key = (user_id, org_id, published_only)
+    entry = _meta_cache.get(cache_key)
+    if entry is not None and time.monotonic() < entry[0]:
+        # Shallow copy so callers can't mutate the cached dict
+        return dict(entry[1])
+
     tools = await as_agent_tools(
         db=db,
         user_id=user_id,
@@ -365,9 +450,19 @@ async def get_skills_session_metadata(
         published_only=published_only,
     )
 
-    return {
+    # Single pass for names/ids; `or ()` avoids allocating an empty list
+    # for every untagged tool on the session-start hot path
+    names = []
+    ids = []
+    for t in tools:
+        names.append(t["name"])
+        ids.append(t["skill_version_id"])
+    metadata = {
         "skill_count": len(tools),
-        "skill_names": [t["name"] for t in tools],
-        "skill_ids": [t["skill_version_id"] for t in tools],
-        "tags": list(set(tag for t in tools for tag in t.get("tags", []))),
+        "skill_names": names,
+        "skill_ids": ids,
+        "tags": list({*chain.from_iterable(t.get("tags") or () for t in tools)}),
     }
+
+    _meta_cache[cache_key] = (time.monotonic() + _META_CACHE_TTL, metadata)
+    return dict(metadata)
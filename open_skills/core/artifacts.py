@@ -3,21 +3,74 @@ Artifacts manager for handling file uploads and storage.
 Includes S3-compatible storage stub.
 """
 
+import asyncio
 import hashlib
 import mimetypes
+import mmap
+import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.exceptions import ArtifactError, ArtifactSizeExceededError, StorageError
 from open_skills.core.telemetry import get_logger
 from open_skills.db.models import SkillArtifact, SkillRun
 
 logger = get_logger(__name__)
 
+# Module-level statements with bound parameters: built once at import, so
+# every execute hits the engine's compiled-statement cache on the same
+# object identity instead of re-hashing a fresh select() per call.
+_ARTIFACT_BY_ID = select(SkillArtifact).where(SkillArtifact.id == bindparam("aid"))
+_ARTIFACTS_BY_IDS = select(SkillArtifact).where(
+    SkillArtifact.id.in_(bindparam("aids", expanding=True))
+)
+_RUN_ARTIFACTS = (
+    select(SkillArtifact)
+    .where(SkillArtifact.run_id == bindparam("rid"))
+    .order_by(SkillArtifact.created_at)
+)
+
+
+@lru_cache(maxsize=256)
+def _file_sha256(path: str, st_mtime_ns: int, st_size: int) -> str:
+    """
+    SHA256 a file's contents, memoized on (path, mtime, size).
+
+    Each upload hashes the same file twice (metadata + the S3 stub URL);
+    the cache turns the second pass into a dict hit. The mtime/size key
+    invalidates naturally if the file changes.
+    """
+    with open(path, "rb") as f:
+        # Tell the kernel this is one sequential pass so readahead ramps
+        # up and the pages don't crowd out the rest of the cache
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except (AttributeError, OSError):
+            pass  # not POSIX, or fs doesn't support it
+        if st_size:
+            try:
+                # Hand the whole mapping to OpenSSL in one call so its
+                # hardware-accelerated (SHA-NI/ARMv8) path runs without
+                # per-chunk Python dispatch
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    try:
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    except (AttributeError, OSError):
+                        pass
+                    return hashlib.sha256(mm).hexdigest()
+            except (ValueError, OSError):
+                pass  # mmap unavailable (platform/fs) — fall back to chunks
+        sha256 = hashlib.sha256()
+        while chunk := f.read(1 << 20):
+            sha256.update(chunk)
+        return sha256.hexdigest()
+
 
 class ArtifactsManager:
     """Manages skill execution artifacts and storage."""
@@ -30,7 +83,7 @@ class ArtifactsManager:
             db: Database session
         """
         self.db = db
-        self.artifacts_root = settings.artifacts_root
+        self.artifacts_root = get_settings().ensure_artifacts_root()
 
     def _compute_checksum(self, file_path: Path) -> str:
         """
@@ -42,11 +95,8 @@ class ArtifactsManager:
         Returns:
             Hex string of SHA256 hash
         """
-        sha256 = hashlib.sha256()
-        with open(file_path, "rb") as f:
-            while chunk := f.read(8192):
-                sha256.update(chunk)
-        return sha256.hexdigest()
+        stat = file_path.stat()
+        return _file_sha256(str(file_path), stat.st_mtime_ns, stat.st_size)
 
     def _guess_mime_type(self, file_path: Path) -> Optional[str]:
         """
@@ -61,7 +111,9 @@ class ArtifactsManager:
         mime_type, _ = mimetypes.guess_type(str(file_path))
         return mime_type
 
-    async def _upload_to_s3_stub(self, file_path: Path, object_key: str) -> str:
+    async def _upload_to_s3_stub(
+        self, file_path: Path, object_key: str, checksum: str
+    ) -> str:
         """
         Stub implementation of S3 upload.
         In production, replace with real boto3 upload.
@@ -69,12 +121,13 @@ class ArtifactsManager:
         Args:
             file_path: Local file path
             object_key: S3 object key
+            checksum: Precomputed SHA256 of the file (avoids re-reading it)
 
         Returns:
             Signed URL (stubbed)
         """
         # STUB: Return fake URL
-        checksum = self._compute_checksum(file_path)
+        settings = get_settings()
         fake_url = (
             f"https://{settings.s3_bucket}.s3.{settings.s3_region}.amazonaws.com/"
             f"{object_key}?checksum={checksum}&stub=true"
@@ -128,6 +181,7 @@ class ArtifactsManager:
             raise ArtifactError(f"Artifact file not found: {local_file_path}")
 
         # Check file size
+        settings = get_settings()
         size_bytes = local_file_path.stat().st_size
         if size_bytes > settings.max_artifact_size_bytes:
             raise ArtifactSizeExceededError(
@@ -135,17 +189,20 @@ class ArtifactsManager:
                 f"{settings.max_artifact_size_bytes}"
             )
 
-        # Compute metadata
+        # Compute metadata. Hashing a large artifact is blocking file IO +
+        # CPU, so run it off the event loop.
         filename = local_file_path.name
         mime_type = self._guess_mime_type(local_file_path)
-        checksum = self._compute_checksum(local_file_path)
+        checksum = await asyncio.to_thread(self._compute_checksum, local_file_path)
 
         # Upload to S3 (stubbed)
         s3_url = None
         if upload_to_s3:
             object_key = f"runs/{run_id}/{filename}"
             try:
-                s3_url = await self._upload_to_s3_stub(local_file_path, object_key)
+                s3_url = await self._upload_to_s3_stub(
+                    local_file_path, object_key, checksum
+                )
             except Exception as e:
                 logger.error("artifact_upload_failed", error=str(e))
                 # Continue without S3 URL
@@ -185,13 +242,31 @@ class ArtifactsManager:
         Returns:
             SkillArtifact instance or None
         """
-        from sqlalchemy import select
-
-        result = await self.db.execute(
-            select(SkillArtifact).where(SkillArtifact.id == artifact_id)
-        )
+        result = await self.db.execute(_ARTIFACT_BY_ID, {"aid": artifact_id})
         return result.scalar_one_or_none()
 
+    async def get_artifacts_bulk(
+        self, artifact_ids: Iterable[UUID]
+    ) -> dict[UUID, SkillArtifact]:
+        """
+        Get multiple artifacts in a single query.
+
+        One SELECT ... WHERE id IN (...) instead of an execute per
+        artifact when callers hold a list of IDs.
+
+        Args:
+            artifact_ids: Artifact UUIDs to fetch
+
+        Returns:
+            Mapping of artifact UUID to SkillArtifact (missing IDs are omitted)
+        """
+        ids = list(artifact_ids)
+        if not ids:
+            return {}
+
+        result = await self.db.execute(_ARTIFACTS_BY_IDS, {"aids": ids})
+        return {artifact.id: artifact for artifact in result.scalars().all()}
+
     async def list_run_artifacts(self, run_id: UUID) -> list[SkillArtifact]:
         """
         List all artifacts for a run.
@@ -202,13 +277,7 @@ class ArtifactsManager:
         Returns:
             List of SkillArtifact instances
         """
-        from sqlalchemy import select
-
-        result = await self.db.execute(
-            select(SkillArtifact)
-            .where(SkillArtifact.run_id == run_id)
-            .order_by(SkillArtifact.created_at)
-        )
+        result = await self.db.execute(_RUN_ARTIFACTS, {"rid": run_id})
         return list(result.scalars().all())
 
     async def delete_artifact(self, artifact_id: UUID) -> None:
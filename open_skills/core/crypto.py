@@ -1,45 +1,135 @@
 """
 Cryptographic utilities for secure secret storage.
-Uses JWT for encrypting sensitive values.
+Single values use AES-256-GCM (actual encryption); dict payloads use
+signed JWTs.
 """
 
+import base64
+import hashlib
+import hmac
+import json
+import os
+from functools import lru_cache
 from typing import Optional
 
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+from cryptography.hazmat.primitives.kdf.hkdf import HKDF
 from jose import jwt, JWTError
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.exceptions import AuthenticationError
 
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), default=str).encode()
+
+    _json_loads = json.loads
+
+# Pre-encoded HS256 JWT header for the single-value fast path: the header
+# never changes, so encode it once at import instead of per token.
+_HS256_HEADER = base64.urlsafe_b64encode(
+    json.dumps({"alg": "HS256", "typ": "JWT"}, separators=(",", ":")).encode()
+).rstrip(b"=")
+
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64url_decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+# AES-GCM nonce size in bytes (the standard 96-bit nonce)
+_NONCE_LEN = 12
+
+
+def _hs256_encode(payload: dict, secret: str) -> str:
+    """Build a compact HS256 JWS with orjson payload serialization."""
+    signing_input = _HS256_HEADER + b"." + _b64url_encode(_json_dumps(payload))
+    signature = hmac.new(secret.encode(), signing_input, hashlib.sha256).digest()
+    return (signing_input + b"." + _b64url_encode(signature)).decode()
+
+
+def _hs256_decode(token: str, secret: str) -> dict:
+    """
+    Verify a compact HS256 JWS and return its payload.
+
+    Mirror of _hs256_encode: checks the HMAC directly and parses the
+    payload with orjson, skipping jose's header/claims machinery.
+
+    Raises:
+        JWTError: If the header or signature is invalid
+    """
+    signing_input, _, signature_b64 = token.rpartition(".")
+    header_b64, _, payload_b64 = signing_input.partition(".")
+    header = _json_loads(_b64url_decode(header_b64))
+    if header.get("alg") != "HS256":
+        raise JWTError("The specified alg value is not allowed")
+    expected = hmac.new(
+        secret.encode(), signing_input.encode(), hashlib.sha256
+    ).digest()
+    if not hmac.compare_digest(expected, _b64url_decode(signature_b64)):
+        raise JWTError("Signature verification failed.")
+    return _json_loads(_b64url_decode(payload_b64))
+
+
+@lru_cache(maxsize=8)
+def _aead_cipher(secret: str) -> AESGCM:
+    """Derive the AES-256-GCM key for a secret (HKDF-SHA256, cached)."""
+    key = HKDF(
+        algorithm=hashes.SHA256(),
+        length=32,
+        salt=None,
+        info=b"open-skills-secret-storage",
+    ).derive(secret.encode())
+    return AESGCM(key)
+
 
 def encrypt_value(value: str, secret: Optional[str] = None) -> str:
     """
-    Encrypt a value using JWT signing.
+    Encrypt a value with AES-256-GCM.
+
+    Earlier revisions "encrypted" via jwt.encode, which only signs — the
+    value sat base64-readable in the token. This is authenticated
+    encryption (OpenSSL dispatches to AES-NI/CLMUL), with the key derived
+    from the configured secret via HKDF.
 
     Args:
         value: The value to encrypt
         secret: Optional secret key (defaults to settings.jwt_secret)
 
     Returns:
-        Encrypted token string
+        Encrypted token string: base64url(nonce || ciphertext)
 
     Raises:
         AuthenticationError: If encryption fails
     """
-    secret_key = secret or settings.jwt_secret
+    secret_key = secret or get_settings().jwt_secret
     try:
-        token = jwt.encode(
-            {"v": value},
-            secret_key,
-            algorithm=settings.jwt_algorithm,
-        )
-        return token
+        nonce = os.urandom(_NONCE_LEN)
+        ciphertext = _aead_cipher(secret_key).encrypt(nonce, value.encode(), None)
+        return _b64url_encode(nonce + ciphertext).decode()
     except Exception as e:
         raise AuthenticationError(f"Failed to encrypt value: {e}")
 
 
 def decrypt_value(token: str, secret: Optional[str] = None) -> str:
     """
-    Decrypt a JWT token to retrieve the original value.
+    Decrypt a token from encrypt_value.
+
+    AES-GCM tokens (no dots) are the current format; compact JWTs from
+    earlier revisions still verify through the signed-token paths so
+    stored values keep decrypting.
 
     Args:
         token: The encrypted token
@@ -51,7 +141,29 @@ def decrypt_value(token: str, secret: Optional[str] = None) -> str:
     Raises:
         AuthenticationError: If decryption fails or token is invalid
     """
+    settings = get_settings()
     secret_key = secret or settings.jwt_secret
+
+    if "." not in token:
+        try:
+            raw = _b64url_decode(token)
+            plaintext = _aead_cipher(secret_key).decrypt(
+                raw[:_NONCE_LEN], raw[_NONCE_LEN:], None
+            )
+            return plaintext.decode()
+        except Exception as e:
+            raise AuthenticationError(f"Failed to decrypt value: {e}")
+
+    if settings.jwt_algorithm == "HS256":
+        try:
+            data = _hs256_decode(token, secret_key)
+        except Exception as e:
+            raise AuthenticationError(f"Failed to decrypt value: {e}")
+        try:
+            return data["v"]
+        except (KeyError, TypeError):
+            raise AuthenticationError("Invalid token format: missing 'v' key")
+
     try:
         data = jwt.decode(
             token,
@@ -79,14 +191,18 @@ def encrypt_dict(data: dict, secret: Optional[str] = None) -> str:
     Raises:
         AuthenticationError: If encryption fails
     """
+    settings = get_settings()
     secret_key = secret or settings.jwt_secret
     try:
-        token = jwt.encode(
+        if settings.jwt_algorithm == "HS256":
+            # Bypass jose's stdlib-json payload serialization — large
+            # secret bundles dominate on dumps, and orjson is C-implemented
+            return _hs256_encode(data, secret_key)
+        return jwt.encode(
             data,
             secret_key,
             algorithm=settings.jwt_algorithm,
         )
-        return token
     except Exception as e:
         raise AuthenticationError(f"Failed to encrypt dict: {e}")
 
@@ -105,15 +221,17 @@ def decrypt_dict(token: str, secret: Optional[str] = None) -> dict:
     Raises:
         AuthenticationError: If decryption fails or token is invalid
     """
+    settings = get_settings()
     secret_key = secret or settings.jwt_secret
     try:
-        data = jwt.decode(
+        if settings.jwt_algorithm == "HS256":
+            return _hs256_decode(token, secret_key)
+        return jwt.decode(
             token,
             secret_key,
             algorithms=[settings.jwt_algorithm],
         )
-        return data
-    except JWTError as e:
+    except (JWTError, ValueError) as e:
         raise AuthenticationError(f"Failed to decrypt dict: {e}")
 
 
@@ -128,6 +246,20 @@ def verify_token(token: str, secret: Optional[str] = None) -> bool:
     Returns:
         True if valid, False otherwise
     """
+    settings = get_settings()
+    if settings.jwt_algorithm == "HS256":
+        # Signature check only — skips the base64/json payload parse that
+        # decrypt_dict does just to throw the payload away
+        secret_key = secret or settings.jwt_secret
+        try:
+            signing_input, _, signature_b64 = token.rpartition(".")
+            expected = hmac.new(
+                secret_key.encode(), signing_input.encode(), hashlib.sha256
+            ).digest()
+            return hmac.compare_digest(expected, _b64url_decode(signature_b64))
+        except (ValueError, AttributeError):
+            return False
+
     try:
         decrypt_dict(token, secret)
         return True
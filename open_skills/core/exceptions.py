@@ -6,94 +6,94 @@ Custom exceptions for open-skills.
 class OpenSkillsError(Exception):
     """Base exception for all open-skills errors."""
 
-    pass
+    __slots__ = ()
 
 
 class ConfigurationError(OpenSkillsError):
     """Raised when configuration is invalid or missing."""
 
-    pass
+    __slots__ = ()
 
 
 class SkillNotFoundError(OpenSkillsError):
     """Raised when a skill is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class SkillVersionNotFoundError(OpenSkillsError):
     """Raised when a skill version is not found."""
 
-    pass
+    __slots__ = ()
 
 
 class SkillValidationError(OpenSkillsError):
     """Raised when skill bundle validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class SkillExecutionError(OpenSkillsError):
     """Raised when skill execution fails."""
 
-    pass
+    __slots__ = ()
 
 
 class SkillTimeoutError(SkillExecutionError):
     """Raised when skill execution exceeds timeout."""
 
-    pass
+    __slots__ = ()
 
 
 class ArtifactError(OpenSkillsError):
     """Raised when artifact handling fails."""
 
-    pass
+    __slots__ = ()
 
 
 class ArtifactSizeExceededError(ArtifactError):
     """Raised when artifact size exceeds limit."""
 
-    pass
+    __slots__ = ()
 
 
 class PermissionDeniedError(OpenSkillsError):
     """Raised when user lacks required permissions."""
 
-    pass
+    __slots__ = ()
 
 
 class AuthenticationError(OpenSkillsError):
     """Raised when authentication fails."""
 
-    pass
+    __slots__ = ()
 
 
 class RateLimitError(OpenSkillsError):
     """Raised when rate limit is exceeded."""
 
-    pass
+    __slots__ = ()
 
 
 class StorageError(OpenSkillsError):
     """Raised when storage operations fail."""
 
-    pass
+    __slots__ = ()
 
 
 class EmbeddingError(OpenSkillsError):
     """Raised when embedding generation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class InvalidInputError(OpenSkillsError):
     """Raised when input validation fails."""
 
-    pass
+    __slots__ = ()
 
 
 class RunNotFoundError(OpenSkillsError):
     """Raised when a run is not found."""
 
-    pass
+    __slots__ = ()
@@ -3,21 +3,29 @@ Skill Executor for dynamic loading and execution of skill code.
 """
 
 import asyncio
+import contextvars
 import importlib.util
+import inspect
+import multiprocessing
 import os
+import shutil
 import sys
-import tempfile
+import threading
 import time
 import traceback
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from uuid import UUID
 import io
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from contextlib import redirect_stdout, redirect_stderr
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.exceptions import (
     SkillExecutionError,
     SkillTimeoutError,
@@ -36,6 +44,431 @@ from open_skills.db.models import SkillRun, SkillVersion
 
 logger = get_logger(__name__)
 
+# Dedicated compute pool for synchronous skill callables. Running them here
+# instead of the event loop's shared default executor keeps CPU-bound skill
+# work from starving unrelated async I/O (DB, HTTP, SSE streaming).
+_compute_pool = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4,
+    thread_name_prefix="open-skills-compute",
+)
+
+# Loaded-entrypoint cache: re-executing a hot skill re-read, re-compiled
+# and re-exec'd its module every run. Keyed on (path, mtime_ns, function)
+# so edits to the file miss naturally; bounded LRU sized by
+# settings.max_cached_skills. The cached function keeps its module's
+# globals alive via __globals__, so no separate module ref is needed.
+_callable_cache: "OrderedDict[tuple, Any]" = OrderedDict()
+_callable_cache_lock = threading.Lock()
+
+
+# Per-task logical stdout/stderr. redirect_stdout swaps the process-global
+# sys.stdout, so parallel runs clobbered each other's capture buffer; a
+# proxy installed once routes writes to the current task's buffer instead.
+_current_stdout: "contextvars.ContextVar[Optional[io.TextIOBase]]" = (
+    contextvars.ContextVar("open_skills_stdout", default=None)
+)
+_current_stderr: "contextvars.ContextVar[Optional[io.TextIOBase]]" = (
+    contextvars.ContextVar("open_skills_stderr", default=None)
+)
+
+
+class _StreamProxy(io.TextIOBase):
+    """Routes writes to the current task's capture buffer, else the real stream."""
+
+    def __init__(self, var, fallback):
+        self._var = var
+        self._fallback = fallback
+
+    def _target(self):
+        return self._var.get() or self._fallback
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name):
+        # Delegate anything else (encoding, isatty, fileno...) to the target
+        return getattr(self._target(), name)
+
+
+_proxies_installed = False
+
+
+def _ensure_stream_proxies() -> None:
+    """Install the stdout/stderr proxies once, on first skill execution."""
+    global _proxies_installed
+    if not _proxies_installed:
+        sys.stdout = _StreamProxy(_current_stdout, sys.stdout)
+        sys.stderr = _StreamProxy(_current_stderr, sys.stderr)
+        _proxies_installed = True
+
+
+class _TailLogBuffer(io.TextIOBase):
+    """
+    Bounded stdout/stderr capture that keeps only the tail.
+
+    io.StringIO held a rogue skill's entire output in RAM; this evicts
+    from the front once max_bytes is exceeded, so memory stays constant
+    regardless of output volume. Complete lines are also streamed to SSE
+    subscribers as they are written (scheduled thread-safely, since sync
+    skills write from compute-pool threads).
+    """
+
+    def __init__(self, max_bytes: int, run_id=None, stream="stdout", loop=None):
+        self._max_bytes = max_bytes
+        self._parts: List[str] = []
+        self._size = 0
+        self._truncated = False
+        self._pending_line = ""
+        self._run_id = run_id
+        self._stream = stream
+        self._loop = loop
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        self._parts.append(s)
+        self._size += len(s)
+        while self._size > self._max_bytes and len(self._parts) > 1:
+            evicted = self._parts.pop(0)
+            self._size -= len(evicted)
+            self._truncated = True
+        if self._size > self._max_bytes:
+            # One oversized write left: keep its tail
+            self._parts[0] = self._parts[0][-self._max_bytes:]
+            self._size = self._max_bytes
+            self._truncated = True
+
+        if self._run_id is not None and self._loop is not None:
+            # Stream complete lines as they arrive; partial lines wait
+            # for their newline
+            self._pending_line += s
+            if "\n" in self._pending_line:
+                *lines, self._pending_line = self._pending_line.split("\n")
+                for line in lines:
+                    asyncio.run_coroutine_threadsafe(
+                        emit_log(self._run_id, line, stream=self._stream),
+                        self._loop,
+                    )
+        return len(s)
+
+    def getvalue(self) -> str:
+        text = "".join(self._parts)
+        if self._truncated:
+            return "... [log truncated] ...\n" + text
+        return text
+
+
+@dataclass(frozen=True)
+class SkillContext:
+    """Per-run execution context handed to skill callables."""
+
+    workdir: Path
+    run_id: UUID
+
+
+# Per-task run context. Set around each skill invocation (and copied into
+# the compute-pool thread for sync callables) so concurrent runs see their
+# own workdir without process-global state.
+_current_context: "contextvars.ContextVar[Optional[SkillContext]]" = (
+    contextvars.ContextVar("open_skills_context", default=None)
+)
+
+
+def get_context() -> Optional[SkillContext]:
+    """Return the SkillContext of the currently executing run, if any."""
+    return _current_context.get()
+
+
+def get_workdir() -> Optional[Path]:
+    """Return the current run's working directory, if inside a skill run."""
+    ctx = _current_context.get()
+    return ctx.workdir if ctx else None
+
+
+def _accepts_context(func) -> bool:
+    """Whether the callable takes an explicit ``ctx`` keyword argument."""
+    try:
+        return "ctx" in inspect.signature(func).parameters
+    except (TypeError, ValueError):
+        return False
+
+
+@lru_cache(maxsize=512)
+def _parse_entrypoint(entrypoint: str) -> tuple:
+    """Split an entrypoint spec into (module path, function name), memoized."""
+    if ":" in entrypoint:
+        mod_path, func_name = entrypoint.split(":", 1)
+    else:
+        mod_path, func_name = entrypoint, "run"
+    return mod_path, func_name
+
+
+def _load_entrypoint(bundle_root: Path, entrypoint: str):
+    """
+    Resolve a skill entrypoint to a callable (module-level so process-pool
+    workers can reuse it — each worker keeps its own callable cache).
+
+    Args:
+        bundle_root: Root directory of skill bundle
+        entrypoint: Entrypoint path (e.g., "scripts/main.py" or "scripts/main.py:run")
+
+    Returns:
+        Callable function
+
+    Raises:
+        SkillExecutionError: If loading fails
+    """
+    try:
+        mod_path, func_name = _parse_entrypoint(entrypoint)
+
+        # Get absolute path to module; the stat doubles as the existence
+        # check, so warm calls pay exactly one syscall
+        target_path = bundle_root / mod_path
+        try:
+            st_mtime_ns = target_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            raise SkillExecutionError(f"Entrypoint file not found: {target_path}")
+
+        cache_key = (str(target_path), st_mtime_ns, func_name)
+        with _callable_cache_lock:
+            cached = _callable_cache.get(cache_key)
+            if cached is not None:
+                _callable_cache.move_to_end(cache_key)
+                return cached
+
+        # Load module dynamically. The spec name embeds the mtime so a
+        # changed file gets a fresh module identity, not a stale reload;
+        # submodule_search_locations gives the module a __path__ so
+        # relative imports resolve inside the bundle without sys.path.
+        spec = importlib.util.spec_from_file_location(
+            f"skill_module_{cache_key[1]}_{id(target_path)}",
+            str(target_path),
+            submodule_search_locations=[str(bundle_root)],
+        )
+        if not spec or not spec.loader:
+            raise SkillExecutionError(f"Failed to load module spec: {target_path}")
+
+        module = importlib.util.module_from_spec(spec)
+
+        # Absolute sibling imports (import helpers) still need the
+        # bundle root on sys.path during exec. Insert/remove just our
+        # entry instead of copy-and-replace, which silently discarded
+        # any concurrent sys.path changes from other threads.
+        bundle_dir = str(bundle_root)
+        inserted = bundle_dir not in sys.path
+        if inserted:
+            sys.path.insert(0, bundle_dir)
+        try:
+            spec.loader.exec_module(module)
+        finally:
+            if inserted:
+                try:
+                    sys.path.remove(bundle_dir)
+                except ValueError:
+                    pass  # removed elsewhere
+
+        # Get the function
+        if not hasattr(module, func_name):
+            raise SkillExecutionError(
+                f"Function '{func_name}' not found in module {mod_path}"
+            )
+
+        func = getattr(module, func_name)
+        if not callable(func):
+            raise SkillExecutionError(
+                f"'{func_name}' in {mod_path} is not callable"
+            )
+
+        # Concurrent first loads may both compile; last write wins,
+        # which is harmless — both callables are equivalent.
+        with _callable_cache_lock:
+            _callable_cache[cache_key] = func
+            max_cached = get_settings().max_cached_skills
+            while len(_callable_cache) > max_cached:
+                _callable_cache.popitem(last=False)
+
+        logger.info(
+            "skill_callable_loaded",
+            module=mod_path,
+            function=func_name,
+        )
+
+        return func
+
+    except Exception as e:
+        if isinstance(e, SkillExecutionError):
+            raise
+        raise SkillExecutionError(f"Failed to load skill callable: {e}")
+
+
+def _run_skill_in_subprocess(
+    bundle_root: str,
+    entrypoint: str,
+    input_payload: Dict[str, Any],
+    workdir: str,
+    run_id: str,
+) -> tuple:
+    """
+    Pool-worker body for isolation:process skills.
+
+    Loads the entrypoint in the child (each worker caches its own
+    callables), runs it under the legacy cwd/env contract — safe here
+    because the whole process belongs to this run — and returns the
+    result plus captured stdout/stderr for the parent to log.
+    """
+    func = _load_entrypoint(Path(bundle_root), entrypoint)
+    old_cwd = os.getcwd()
+    os.chdir(workdir)
+    os.environ["OPEN_SKILLS_WORKDIR"] = workdir
+    os.environ["OPEN_SKILLS_RUN_ID"] = run_id
+    # Bounded tail capture (no live streaming from the child process)
+    max_log_bytes = get_settings().max_log_bytes
+    stdout_capture = _TailLogBuffer(max_log_bytes)
+    stderr_capture = _TailLogBuffer(max_log_bytes)
+    try:
+        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
+            if asyncio.iscoroutinefunction(func):
+                result = asyncio.run(func(input_payload))
+            else:
+                result = func(input_payload)
+    finally:
+        os.chdir(old_cwd)
+        os.environ.pop("OPEN_SKILLS_WORKDIR", None)
+        os.environ.pop("OPEN_SKILLS_RUN_ID", None)
+    return result, stdout_capture.getvalue(), stderr_capture.getvalue()
+
+
+# Process pool for skills that declare `isolation: process` in their
+# metadata: CPU-bound sync skills scale across cores instead of fighting
+# the event loop for the GIL, and a timed-out run's CPU can be reclaimed
+# by recycling the pool. Created lazily so service processes that never
+# run such skills don't fork workers.
+_sync_pool: Optional[ProcessPoolExecutor] = None
+_sync_pool_lock = threading.Lock()
+
+
+def _get_sync_pool() -> ProcessPoolExecutor:
+    """Return the shared process pool, creating it on first use."""
+    global _sync_pool
+    with _sync_pool_lock:
+        if _sync_pool is None:
+            try:
+                mp_context = multiprocessing.get_context("forkserver")
+            except ValueError:  # platform without forkserver
+                mp_context = multiprocessing.get_context("spawn")
+            _sync_pool = ProcessPoolExecutor(
+                max_workers=get_settings().sync_workers,
+                mp_context=mp_context,
+            )
+        return _sync_pool
+
+
+def _fast_wipe(path: Path) -> None:
+    """Remove a workdir's contents, leaving the directory itself."""
+    for p in path.iterdir():
+        try:
+            if p.is_dir() and not p.is_symlink():
+                shutil.rmtree(p, ignore_errors=True)
+            else:
+                p.unlink()
+        except OSError:
+            pass  # best-effort; leftovers get wiped on process restart
+
+
+# Pool of pre-created run workdirs under artifacts_root/_workdirs.
+# Creating and rmtree-ing a TemporaryDirectory per run cost several
+# syscalls of pure overhead for short skills; checked-out dirs are wiped
+# and returned in the background instead. Queue depth doubles as a
+# concurrency bound on simultaneous runs.
+_workdir_pool: Optional[asyncio.Queue] = None
+_workdir_recycle_tasks: set = set()
+
+
+def _get_workdir_pool() -> "asyncio.Queue[Path]":
+    """Return the workdir pool, creating the directories on first use."""
+    global _workdir_pool
+    if _workdir_pool is None:
+        settings = get_settings()
+        root = settings.ensure_artifacts_root() / "_workdirs"
+        root.mkdir(parents=True, exist_ok=True)
+        # Quarantined dirs from timed-out runs are only safe to delete
+        # once their writer is certainly gone — i.e. on a fresh process
+        for stale in root.glob("dead-*"):
+            shutil.rmtree(stale, ignore_errors=True)
+        pool: asyncio.Queue = asyncio.Queue()
+        for i in range(settings.max_concurrent_runs):
+            d = root / f"wd-{os.getpid()}-{i}"
+            d.mkdir(exist_ok=True)
+            _fast_wipe(d)  # clear leftovers from a crashed predecessor
+            pool.put_nowait(d)
+        _workdir_pool = pool
+    return _workdir_pool
+
+
+async def _checkout_workdir() -> Path:
+    """Borrow a clean workdir; waits if all are in use."""
+    return await _get_workdir_pool().get()
+
+
+def _release_workdir(path: Path) -> None:
+    """Wipe a workdir off the critical path and return it to the pool."""
+
+    async def _recycle() -> None:
+        await asyncio.to_thread(_fast_wipe, path)
+        _get_workdir_pool().put_nowait(path)
+
+    task = asyncio.get_event_loop().create_task(_recycle())
+    _workdir_recycle_tasks.add(task)
+    task.add_done_callback(_workdir_recycle_tasks.discard)
+
+
+def _discard_workdir(path: Path) -> None:
+    """
+    Retire a workdir whose run may still be writing.
+
+    A timed-out skill keeps running — compute-pool threads can't be
+    cancelled and a process worker may outlive the pool reset — so
+    recycling its directory would leak late writes into a later run's
+    artifact scan. Rename it out of the pool's namespace (cleaned up on
+    the next process start, when the writer is certainly gone) and put a
+    freshly created directory into the pool instead.
+    """
+    try:
+        path.rename(path.with_name(f"dead-{path.name}-{time.time_ns()}"))
+    except OSError:
+        pass  # rename failed; the dir still never re-enters the pool
+    fresh = path.parent / f"wd-{os.getpid()}-x{time.time_ns()}"
+    try:
+        fresh.mkdir(exist_ok=True)
+    except OSError:
+        logger.warning("workdir_replacement_failed", path=str(fresh))
+        return  # pool shrinks by one rather than pooling a dirty dir
+    _get_workdir_pool().put_nowait(fresh)
+
+
+def _reset_sync_pool() -> None:
+    """
+    Discard the process pool after a timeout.
+
+    ProcessPoolExecutor can't kill one worker, so the timed-out run's
+    worker would otherwise burn CPU until it finished; recycling the pool
+    reclaims it. In-flight process-isolated runs are sacrificed — the
+    trade-off of sharing one pool.
+    """
+    global _sync_pool
+    with _sync_pool_lock:
+        pool, _sync_pool = _sync_pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+        logger.warning("sync_pool_recycled_after_timeout")
+
 
 class SkillExecutor:
     """Executes skill code in isolated contexts with timeouts."""
@@ -67,76 +500,27 @@ class SkillExecutor:
         Raises:
             SkillExecutionError: If loading fails
         """
-        try:
-            # Parse entrypoint
-            if ":" in entrypoint:
-                mod_path, func_name = entrypoint.split(":", 1)
-            else:
-                mod_path, func_name = entrypoint, "run"
-
-            # Get absolute path to module
-            target_path = bundle_root / mod_path
-            if not target_path.exists():
-                raise SkillExecutionError(f"Entrypoint file not found: {target_path}")
-
-            # Load module dynamically
-            spec = importlib.util.spec_from_file_location(
-                f"skill_module_{id(target_path)}",
-                str(target_path),
-            )
-            if not spec or not spec.loader:
-                raise SkillExecutionError(f"Failed to load module spec: {target_path}")
-
-            module = importlib.util.module_from_spec(spec)
-
-            # Add bundle root to sys.path temporarily
-            old_sys_path = sys.path.copy()
-            sys.path.insert(0, str(bundle_root))
-
-            try:
-                spec.loader.exec_module(module)
-            finally:
-                # Restore sys.path
-                sys.path = old_sys_path
-
-            # Get the function
-            if not hasattr(module, func_name):
-                raise SkillExecutionError(
-                    f"Function '{func_name}' not found in module {mod_path}"
-                )
-
-            func = getattr(module, func_name)
-            if not callable(func):
-                raise SkillExecutionError(
-                    f"'{func_name}' in {mod_path} is not callable"
-                )
-
-            logger.info(
-                "skill_callable_loaded",
-                module=mod_path,
-                function=func_name,
-            )
-
-            return func
-
-        except Exception as e:
-            if isinstance(e, SkillExecutionError):
-                raise
-            raise SkillExecutionError(f"Failed to load skill callable: {e}")
+        return _load_entrypoint(bundle_root, entrypoint)
 
     async def _create_run_record(
         self,
         skill_version_id: UUID,
         input_payload: Dict[str, Any],
         user_id: Optional[UUID] = None,
+        status: str = "queued",
     ) -> SkillRun:
         """
         Create a new skill run record in the database.
 
+        All columns (including id and created_at) carry client-side
+        defaults, so one flush covers the insert and no refresh round-trip
+        is needed.
+
         Args:
             skill_version_id: Skill version UUID
             input_payload: Input data
             user_id: Optional user ID
+            status: Initial run status
 
         Returns:
             Created SkillRun instance
@@ -145,13 +529,12 @@ class SkillExecutor:
             skill_version_id=skill_version_id,
             user_id=user_id,
             input_json=input_payload,
-            status="queued",
+            status=status,
         )
         self.db.add(run)
         await self.db.flush()
-        await self.db.refresh(run)
 
-        logger.info("skill_run_created", run_id=str(run.id), status="queued")
+        logger.info("skill_run_created", run_id=str(run.id), status=status)
 
         return run
 
@@ -163,6 +546,7 @@ class SkillExecutor:
         duration_ms: Optional[int] = None,
         logs: Optional[str] = None,
         error_message: Optional[str] = None,
+        log=None,
     ) -> None:
         """
         Update skill run record.
@@ -174,6 +558,7 @@ class SkillExecutor:
             duration_ms: Execution duration in milliseconds
             logs: Execution logs
             error_message: Error message if failed
+            log: Pre-bound run logger (avoids re-binding run_id per call)
         """
         run.status = status
         if output_json:
@@ -189,15 +574,17 @@ class SkillExecutor:
             from datetime import datetime, timezone
             run.completed_at = datetime.now(timezone.utc)
 
+        # No refresh: every value written above is already the in-memory
+        # state, and no server-generated column is read back.
         await self.db.flush()
-        await self.db.refresh(run)
 
         # Emit streaming event
         await emit_status(run.id, status)
 
-        logger.info(
+        if log is None:
+            log = logger.bind(run_id=str(run.id))
+        log.info(
             "skill_run_updated",
-            run_id=str(run.id),
             status=status,
             duration_ms=duration_ms,
         )
@@ -225,14 +612,18 @@ class SkillExecutor:
             SkillExecutionError: If execution fails
             SkillTimeoutError: If execution times out
         """
-        # Create run record
+        # Create run record already in "running" state: one INSERT instead
+        # of insert-then-update, which matters for skills finishing in
+        # single-digit milliseconds
         run = await self._create_run_record(
             skill_version_id=skill_version.id,
             input_payload=input_payload,
             user_id=user_id,
+            status="running",
         )
 
         # Get timeout
+        settings = get_settings()
         metadata = skill_version.metadata_yaml or {}
         timeout = (
             timeout_seconds
@@ -250,111 +641,133 @@ class SkillExecutor:
 
         start_time = time.perf_counter()
         skill_name = metadata.get("name", "unknown")
+        use_process = metadata.get("isolation") == "process"
+
+        # Bind the run context once; every log line below reuses it
+        # instead of re-stringifying run.id per call
+        run_log = logger.bind(run_id=str(run.id), skill=skill_name)
 
         # Start tracing
         with run_trace(run.id, skill_name=skill_name, user_id=str(user_id) if user_id else None) as trace:
             try:
-                # Update status to running
-                await self._update_run_status(run, "running")
+                # Announce the running state to stream subscribers (the row
+                # was inserted as "running" above)
+                await emit_status(run.id, "running")
 
                 # Load the callable
                 func = await self._load_callable(bundle_path, skill_version.entrypoint)
 
-                # Create temporary working directory for artifacts
-                with tempfile.TemporaryDirectory(prefix="open-skills-") as workdir:
-                    workdir_path = Path(workdir)
-
-                    # Set up environment
-                    old_cwd = os.getcwd()
-                    os.chdir(workdir)
-                    os.environ["OPEN_SKILLS_WORKDIR"] = str(workdir_path)
-                    os.environ["OPEN_SKILLS_RUN_ID"] = str(run.id)
-
-                    # Capture stdout/stderr
-                    stdout_capture = io.StringIO()
-                    stderr_capture = io.StringIO()
+                # Check out a pooled working directory for artifacts
+                workdir_path = await _checkout_workdir()
+                workdir = str(workdir_path)
+                try:
+                    ctx = SkillContext(workdir=workdir_path, run_id=run.id)
+
+                    if use_process:
+                        # isolation: process — run in the shared process
+                        # pool: true multi-core parallelism for CPU-bound
+                        # skills, and a timeout can reclaim the CPU by
+                        # recycling the pool. Requires picklable payloads.
+                        result, stdout_log, stderr_log = await asyncio.wait_for(
+                            asyncio.get_event_loop().run_in_executor(
+                                _get_sync_pool(),
+                                _run_skill_in_subprocess,
+                                str(bundle_path),
+                                skill_version.entrypoint,
+                                input_payload,
+                                workdir,
+                                str(run.id),
+                            ),
+                            timeout=timeout,
+                        )
+                        return await self._finish_run(
+                            run, workdir_path, result, stdout_log,
+                            stderr_log, start_time, trace, log=run_log,
+                        )
+
+                    # Modern contract: the callable takes ctx explicitly
+                    # and no process-global state is touched, so parallel
+                    # runs can't trample each other's cwd/env. Callables
+                    # without a ctx parameter fall back to the legacy
+                    # chdir + env-var contract (deprecated).
+                    accepts_ctx = _accepts_context(func)
+                    if accepts_ctx:
+                        call = partial(func, input_payload, ctx=ctx)
+                    else:
+                        call = partial(func, input_payload)
+                        old_cwd = os.getcwd()
+                        os.chdir(workdir)
+                        os.environ["OPEN_SKILLS_WORKDIR"] = str(workdir_path)
+                        os.environ["OPEN_SKILLS_RUN_ID"] = str(run.id)
+
+                    # Capture stdout/stderr: bounded tail buffers that also
+                    # stream complete lines to SSE subscribers live
+                    max_log_bytes = settings.max_log_bytes
+                    loop = asyncio.get_event_loop()
+                    stdout_capture = _TailLogBuffer(
+                        max_log_bytes, run_id=run.id, stream="stdout", loop=loop
+                    )
+                    stderr_capture = _TailLogBuffer(
+                        max_log_bytes, run_id=run.id, stream="stderr", loop=loop
+                    )
 
+                    # Per-task capture: the proxies route this task's
+                    # writes (including from its compute-pool thread, via
+                    # copy_context) to these buffers without touching what
+                    # parallel runs see
+                    _ensure_stream_proxies()
+                    ctx_token = _current_context.set(ctx)
+                    out_token = _current_stdout.set(stdout_capture)
+                    err_token = _current_stderr.set(stderr_capture)
                     try:
-                        with redirect_stdout(stdout_capture), redirect_stderr(stderr_capture):
-                            # Execute with timeout
-                            if asyncio.iscoroutinefunction(func):
-                                result = await asyncio.wait_for(
-                                    func(input_payload),
-                                    timeout=timeout,
-                                )
-                            else:
-                                # Run sync function in executor
-                                result = await asyncio.wait_for(
-                                    asyncio.get_event_loop().run_in_executor(
-                                        None, func, input_payload
-                                    ),
-                                    timeout=timeout,
-                                )
-                    finally:
-                        # Restore environment
-                        os.chdir(old_cwd)
-                        os.environ.pop("OPEN_SKILLS_WORKDIR", None)
-                        os.environ.pop("OPEN_SKILLS_RUN_ID", None)
-
-                    # Collect outputs
-                    outputs = result.get("outputs", {}) if isinstance(result, dict) else {}
-                    artifact_files = result.get("artifacts", []) if isinstance(result, dict) else []
-
-                    # Process artifacts (will be handled by artifacts manager)
-                    artifact_records = []
-                    for artifact_file in artifact_files:
-                        artifact_path = workdir_path / artifact_file
-                        if artifact_path.exists():
-                            # For now, just record the file info
-                            # In full implementation, upload to S3 here
-                            size_bytes = artifact_path.stat().st_size
-                            artifact_records.append({
-                                "filename": artifact_path.name,
-                                "local_path": str(artifact_path),
-                                "size_bytes": size_bytes,
-                            })
-                            # Emit artifact event
-                            await emit_artifact(
-                                run.id,
-                                artifact_path.name,
-                                size_bytes=size_bytes,
+                        # Execute with timeout
+                        if asyncio.iscoroutinefunction(func):
+                            result = await asyncio.wait_for(
+                                call(),
+                                timeout=timeout,
                             )
-
-                    # Collect logs
-                    stdout_log = stdout_capture.getvalue()
-                    stderr_log = stderr_capture.getvalue()
-                    combined_logs = f"=== STDOUT ===\n{stdout_log}\n\n=== STDERR ===\n{stderr_log}"
-
-                    # Calculate duration
-                    duration_ms = int((time.perf_counter() - start_time) * 1000)
-
-                    # Update run record
-                    await self._update_run_status(
-                        run,
-                        "success",
-                        output_json=outputs,
-                        duration_ms=duration_ms,
-                        logs=combined_logs,
+                        else:
+                            # Run sync function in the dedicated compute
+                            # pool; copy_context carries the run context
+                            # into the worker thread for get_workdir()
+                            result = await asyncio.wait_for(
+                                asyncio.get_event_loop().run_in_executor(
+                                    _compute_pool,
+                                    contextvars.copy_context().run,
+                                    call,
+                                ),
+                                timeout=timeout,
+                            )
+                    finally:
+                        _current_stdout.reset(out_token)
+                        _current_stderr.reset(err_token)
+                        _current_context.reset(ctx_token)
+                        if not accepts_ctx:
+                            # Restore legacy process-global state
+                            os.chdir(old_cwd)
+                            os.environ.pop("OPEN_SKILLS_WORKDIR", None)
+                            os.environ.pop("OPEN_SKILLS_RUN_ID", None)
+
+                    return await self._finish_run(
+                        run, workdir_path, result,
+                        stdout_capture.getvalue(), stderr_capture.getvalue(),
+                        start_time, trace, log=run_log,
                     )
-
-                    trace.event("execution_completed", {
-                        "duration_ms": duration_ms,
-                        "artifact_count": len(artifact_records),
-                    })
-
-                    # Emit completion event
-                    await emit_complete(run.id, "success", outputs, duration_ms)
-
-                    return {
-                        "run_id": str(run.id),
-                        "status": "success",
-                        "outputs": outputs,
-                        "artifacts": artifact_records,
-                        "duration_ms": duration_ms,
-                        "logs": combined_logs,
-                    }
+                finally:
+                    exc_type = sys.exc_info()[0]
+                    if exc_type is not None and issubclass(
+                        exc_type, (asyncio.TimeoutError, asyncio.CancelledError)
+                    ):
+                        # The skill may still be running and writing here
+                        _discard_workdir(workdir_path)
+                    else:
+                        _release_workdir(workdir_path)
 
             except asyncio.TimeoutError:
+                if use_process:
+                    # The pool worker keeps running after wait_for gives
+                    # up; recycle the pool to reclaim its CPU
+                    _reset_sync_pool()
                 duration_ms = int((time.perf_counter() - start_time) * 1000)
                 error_msg = f"Execution timed out after {timeout}s"
 
@@ -363,14 +776,14 @@ class SkillExecutor:
                     "error",
                     duration_ms=duration_ms,
                     error_message=error_msg,
+                    log=run_log,
                 )
 
                 # Emit error event
                 await emit_error(run.id, error_msg)
 
-                logger.error(
+                run_log.error(
                     "skill_execution_timeout",
-                    run_id=str(run.id),
                     timeout=timeout,
                     duration_ms=duration_ms,
                 )
@@ -388,20 +801,107 @@ class SkillExecutor:
                     duration_ms=duration_ms,
                     error_message=error_msg,
                     logs=tb,
+                    log=run_log,
                 )
 
                 # Emit error event
                 await emit_error(run.id, error_msg, tb)
 
-                logger.exception(
+                run_log.exception(
                     "skill_execution_error",
-                    run_id=str(run.id),
                     error=error_msg,
                     duration_ms=duration_ms,
                 )
 
                 raise SkillExecutionError(f"Execution failed: {error_msg}") from e
 
+    async def _finish_run(
+        self,
+        run: SkillRun,
+        workdir_path: Path,
+        result: Any,
+        stdout_log: str,
+        stderr_log: str,
+        start_time: float,
+        trace,
+        log=None,
+    ) -> Dict[str, Any]:
+        """
+        Collect outputs/artifacts/logs and mark a run successful.
+
+        Shared tail of execute_one for the in-process and process-pool
+        execution paths.
+        """
+        outputs = result.get("outputs", {}) if isinstance(result, dict) else {}
+        artifact_files = result.get("artifacts", []) if isinstance(result, dict) else []
+
+        # Process artifacts (will be handled by artifacts manager). One
+        # scandir provides cached stat results for the common top-level
+        # case; nested paths fall back to an explicit stat.
+        artifact_records = []
+        if artifact_files:
+            with os.scandir(workdir_path) as it:
+                entries = {e.name: e for e in it}
+            for artifact_file in artifact_files:
+                entry = entries.get(artifact_file)
+                if entry is not None and entry.is_file():
+                    artifact_path = workdir_path / artifact_file
+                    size_bytes = entry.stat().st_size
+                else:
+                    artifact_path = workdir_path / artifact_file
+                    if not artifact_path.exists():
+                        continue
+                    size_bytes = artifact_path.stat().st_size
+                # For now, just record the file info
+                # In full implementation, upload to S3 here
+                artifact_records.append({
+                    "filename": artifact_path.name,
+                    "local_path": str(artifact_path),
+                    "size_bytes": size_bytes,
+                })
+
+            # Emit artifact events concurrently instead of one awaited
+            # round-trip per file
+            if artifact_records:
+                await asyncio.gather(*(
+                    emit_artifact(
+                        run.id, r["filename"], size_bytes=r["size_bytes"]
+                    )
+                    for r in artifact_records
+                ))
+
+        combined_logs = f"=== STDOUT ===\n{stdout_log}\n\n=== STDERR ===\n{stderr_log}"
+
+        # Calculate duration
+        duration_ms = int((time.perf_counter() - start_time) * 1000)
+
+        # Update run record
+        await self._update_run_status(
+            run,
+            "success",
+            output_json=outputs,
+            duration_ms=duration_ms,
+            logs=combined_logs,
+            log=log,
+        )
+
+        trace.event("execution_completed", {
+            "duration_ms": duration_ms,
+            "artifact_count": len(artifact_records),
+        })
+
+        # Emit completion event
+        await emit_complete(run.id, "success", outputs, duration_ms)
+
+        return {
+            "run_id": str(run.id),
+            "status": "success",
+            "outputs": outputs,
+            "artifacts": artifact_records,
+            "duration_ms": duration_ms,
+            "logs": combined_logs,
+        }
+
     async def execute_many(
         self,
         skill_versions: List[SkillVersion],
@@ -425,27 +925,31 @@ class SkillExecutor:
             SkillExecutionError: If any execution fails
         """
         if strategy == "parallel":
-            # Execute all in parallel
-            tasks = [
-                self.execute_one(version, input_payload, user_id)
-                for version in skill_versions
-            ]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-
-            # Convert exceptions to error dicts
-            formatted_results = []
-            for i, result in enumerate(results):
-                if isinstance(result, Exception):
-                    formatted_results.append({
-                        "run_id": None,
-                        "status": "error",
-                        "error": str(result),
-                        "skill_version_id": str(skill_versions[i].id),
-                    })
-                else:
-                    formatted_results.append(result)
+            # Bounded fan-out: an unbounded gather saturated the DB pool
+            # and compute threads when many skills ran at once
+            sem = asyncio.Semaphore(get_settings().max_parallel_runs)
 
-            return formatted_results
+            async def _one(version: SkillVersion) -> Dict[str, Any]:
+                async with sem:
+                    try:
+                        return await self.execute_one(
+                            version, input_payload, user_id
+                        )
+                    except Exception as e:
+                        # Per-skill failures become error dicts — the old
+                        # return_exceptions=True contract — and never reach
+                        # the TaskGroup, so siblings aren't cancelled
+                        return {
+                            "run_id": None,
+                            "status": "error",
+                            "error": str(e),
+                            "skill_version_id": str(version.id),
+                        }
+
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(_one(v)) for v in skill_versions]
+
+            return [t.result() for t in tasks]
 
         elif strategy == "chain":
             # Execute sequentially, passing output to next input
@@ -3,13 +3,19 @@ Library mode configuration and initialization.
 Provides a global configuration API for embedding open-skills in any application.
 """
 
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Optional
+from typing import AsyncIterator, Optional
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.telemetry import logger
-from open_skills.db.base import Base, engine as default_engine
+from open_skills.db.base import (
+    Base,
+    engine as default_engine,
+    json_deserializer,
+    json_serializer,
+)
 
 
 class LibraryConfig:
@@ -29,7 +35,7 @@ class LibraryConfig:
     @property
     def database_url(self) -> Optional[str]:
         """Get configured database URL."""
-        return self._database_url or settings.database_url
+        return self._database_url or get_settings().database_url
 
     @property
     def engine(self):
@@ -53,6 +59,18 @@ class LibraryConfig:
         Yields:
             AsyncSession: Database session
         """
+        async with self.session() as session:
+            yield session
+
+    @asynccontextmanager
+    async def session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Open a session as an async context manager.
+
+        Same commit-on-success / rollback-on-error semantics as get_db,
+        without the async-generator iteration protocol — preferred for
+        internal call sites that just need one session scope.
+        """
         async with self.session_factory() as session:
             try:
                 yield session
@@ -60,13 +78,15 @@ class LibraryConfig:
             except Exception:
                 await session.rollback()
                 raise
-            finally:
-                await session.close()
 
 
 # Global library config instance
 _lib_config = LibraryConfig()
 
+# Hash of the last applied configure() arguments, used to make repeated
+# identical calls no-ops (re-creating the engine leaks the old pool).
+_last_config_key: Optional[tuple] = None
+
 
 def configure(
     database_url: Optional[str] = None,
@@ -99,10 +119,26 @@ def configure(
         )
         ```
     """
-    global _lib_config
+    global _lib_config, _last_config_key
+
+    # Idempotence: repeated calls with identical arguments (common when
+    # several entry points each call configure defensively) skip the
+    # expensive engine/pool re-creation.
+    config_key = (
+        database_url,
+        str(storage_root) if storage_root else None,
+        str(artifacts_root) if artifacts_root else None,
+        openai_api_key,
+        tuple(sorted(kwargs.items())),
+    )
+    if _lib_config._initialized and config_key == _last_config_key:
+        logger.debug("library_already_configured")
+        return
 
     logger.info("configuring_library_mode")
 
+    settings = get_settings()
+
     # Update database URL
     if database_url:
         _lib_config._database_url = database_url
@@ -112,6 +148,9 @@ def configure(
             pool_size=settings.db_pool_size,
             max_overflow=settings.db_max_overflow,
             pool_pre_ping=True,
+            query_cache_size=1200,
+            json_serializer=json_serializer,
+            json_deserializer=json_deserializer,
         )
         _lib_config._session_factory = async_sessionmaker(
             _lib_config._engine,
@@ -139,11 +178,15 @@ def configure(
             setattr(settings, key, value)
 
     _lib_config._initialized = True
+    _last_config_key = config_key
 
     logger.info(
         "library_configured",
         database_url=bool(_lib_config._database_url),
         storage_root=str(settings.storage_root),
+        pool_status=(
+            _lib_config._engine.pool.status() if _lib_config._engine else None
+        ),
     )
 
 
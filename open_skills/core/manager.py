@@ -10,7 +10,7 @@ from uuid import UUID
 from sqlalchemy import select, and_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.exceptions import (
     SkillNotFoundError,
     SkillVersionNotFoundError,
@@ -24,6 +24,19 @@ from open_skills.db.models import Skill, SkillVersion, User
 logger = get_logger(__name__)
 
 
+def _invalidate_manifest_caches() -> None:
+    """Drop every cache derived from publish state (manifest, prompts, metadata)."""
+    # Local imports to avoid a module cycle with the adapters package
+    from open_skills.core.adapters.agent_tool_api import invalidate_manifest_cache
+    from open_skills.core.adapters.prompt_injection import (
+        invalidate_prompt_cache,
+        invalidate_session_metadata_cache,
+    )
+    invalidate_manifest_cache()
+    invalidate_prompt_cache()
+    invalidate_session_metadata_cache()
+
+
 class SkillManager:
     """Manages skill CRUD operations, versioning, and storage."""
 
@@ -36,7 +49,7 @@ class SkillManager:
             storage_root: Root directory for skill storage (defaults to settings)
         """
         self.db = db
-        self.storage_root = storage_root or settings.storage_root
+        self.storage_root = storage_root or get_settings().ensure_storage_root()
 
     async def create_skill(
         self,
@@ -278,6 +291,27 @@ class SkillManager:
 
         return version
 
+    async def get_skill_versions(self, version_ids: List[UUID]) -> Dict[UUID, SkillVersion]:
+        """
+        Get multiple skill versions in a single query.
+
+        Useful for prefetching when several tool calls reference distinct
+        versions — one SELECT ... WHERE id IN (...) instead of N round-trips.
+
+        Args:
+            version_ids: Version UUIDs to fetch
+
+        Returns:
+            Mapping of version UUID to SkillVersion (missing IDs are omitted)
+        """
+        if not version_ids:
+            return {}
+
+        result = await self.db.execute(
+            select(SkillVersion).where(SkillVersion.id.in_(version_ids))
+        )
+        return {version.id: version for version in result.scalars().all()}
+
     async def get_skill_version_by_number(
         self,
         skill_id: UUID,
@@ -353,6 +387,10 @@ class SkillManager:
             version=version.version,
         )
 
+        # Publish state feeds the tool manifest and rendered prompts;
+        # drop all cached copies
+        _invalidate_manifest_caches()
+
         return version
 
     async def unpublish_version(self, version_id: UUID) -> SkillVersion:
@@ -380,6 +418,8 @@ class SkillManager:
             version=version.version,
         )
 
+        _invalidate_manifest_caches()
+
         return version
 
     async def update_version_embedding(
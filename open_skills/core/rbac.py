@@ -113,11 +113,25 @@ class RBACManager:
         """
         self.db = db
 
+    @staticmethod
+    def _highest_role(permissions) -> Optional[Role]:
+        """Return the highest role among permission rows, or None."""
+        if not permissions:
+            return None
+
+        roles = [Role(p.role) for p in permissions]
+        for role in [Role.ADMIN, Role.PUBLISHER, Role.AUTHOR, Role.VIEWER]:
+            if role in roles:
+                return role
+
+        return None
+
     async def get_user_role(
         self,
         user_id: UUID,
         skill_id: Optional[UUID] = None,
         org_id: Optional[UUID] = None,
+        user: Optional[User] = None,
     ) -> Optional[Role]:
         """
         Get user's role for a skill, org, or globally.
@@ -126,10 +140,23 @@ class RBACManager:
             user_id: User UUID
             skill_id: Optional skill ID (specific skill permission)
             org_id: Optional org ID (org-level permission)
+            user: Optional User with permissions preloaded by
+                get_current_user; when present the check is resolved
+                in memory without another DB round-trip
 
         Returns:
             Highest role the user has, or None
         """
+        preloaded = getattr(user, "_preloaded_permissions", None)
+        if preloaded is not None:
+            permissions = [
+                p for p in preloaded
+                if (not skill_id and not org_id)
+                or (skill_id and p.skill_id == skill_id)
+                or (org_id and p.org_id == org_id)
+            ]
+            return self._highest_role(permissions)
+
         query = select(SkillPermission).where(
             SkillPermission.user_id == user_id
         )
@@ -147,16 +174,7 @@ class RBACManager:
         result = await self.db.execute(query)
         permissions = list(result.scalars().all())
 
-        if not permissions:
-            return None
-
-        # Return highest role in hierarchy
-        roles = [Role(p.role) for p in permissions]
-        for role in [Role.ADMIN, Role.PUBLISHER, Role.AUTHOR, Role.VIEWER]:
-            if role in roles:
-                return role
-
-        return None
+        return self._highest_role(permissions)
 
     async def has_permission(
         self,
@@ -164,6 +182,7 @@ class RBACManager:
         permission: Permission,
         skill_id: Optional[UUID] = None,
         org_id: Optional[UUID] = None,
+        user: Optional[User] = None,
     ) -> bool:
         """
         Check if user has a specific permission.
@@ -173,11 +192,12 @@ class RBACManager:
             permission: Permission to check
             skill_id: Optional skill ID
             org_id: Optional org ID
+            user: Optional User with preloaded permissions (skips the DB)
 
         Returns:
             True if user has permission, False otherwise
         """
-        role = await self.get_user_role(user_id, skill_id, org_id)
+        role = await self.get_user_role(user_id, skill_id, org_id, user=user)
         if not role:
             return False
 
@@ -191,6 +211,7 @@ class RBACManager:
         permission: Permission,
         skill_id: Optional[UUID] = None,
         org_id: Optional[UUID] = None,
+        user: Optional[User] = None,
     ) -> None:
         """
         Require that user has a specific permission.
@@ -200,11 +221,14 @@ class RBACManager:
             permission: Required permission
             skill_id: Optional skill ID
             org_id: Optional org ID
+            user: Optional User with preloaded permissions (skips the DB)
 
         Raises:
             PermissionDeniedError: If user lacks permission
         """
-        has_perm = await self.has_permission(user_id, permission, skill_id, org_id)
+        has_perm = await self.has_permission(
+            user_id, permission, skill_id, org_id, user=user
+        )
         if not has_perm:
             raise PermissionDeniedError(
                 f"User {user_id} lacks permission: {permission.value}"
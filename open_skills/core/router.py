@@ -9,7 +9,7 @@ import httpx
 from sqlalchemy import select, and_, or_, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from open_skills.config import settings
+from open_skills.config import get_settings
 from open_skills.core.exceptions import EmbeddingError
 from open_skills.core.telemetry import get_logger, trace_operation
 from open_skills.db.models import SkillVersion, Skill
@@ -43,6 +43,7 @@ class SkillRouter:
             EmbeddingError: If embedding generation fails
         """
         with trace_operation("generate_embedding", {"text_length": len(text)}):
+            settings = get_settings()
             try:
                 async with httpx.AsyncClient(timeout=30.0) as client:
                     response = await client.post(
@@ -72,6 +73,18 @@ class SkillRouter:
             except (KeyError, IndexError) as e:
                 raise EmbeddingError(f"Invalid embedding response format: {e}")
 
+    @staticmethod
+    def embedding_text(version: SkillVersion) -> str:
+        """Build the canonical embedding text for a version's metadata."""
+        metadata = version.metadata_yaml or {}
+        name = metadata.get("name", "")
+        description = version.description or metadata.get("description", "")
+        tags = metadata.get("tags", [])
+        tags_str = ", ".join(tags) if tags else ""
+
+        # Combine fields for embedding
+        return f"{name}. {description}. Tags: {tags_str}"
+
     async def embed_skill_version(
         self,
         version: SkillVersion,
@@ -90,18 +103,7 @@ class SkillRouter:
         Raises:
             EmbeddingError: If embedding generation fails
         """
-        if custom_text:
-            text = custom_text
-        else:
-            # Create embedding text from metadata
-            metadata = version.metadata_yaml or {}
-            name = metadata.get("name", "")
-            description = version.description or metadata.get("description", "")
-            tags = metadata.get("tags", [])
-            tags_str = ", ".join(tags) if tags else ""
-
-            # Combine fields for embedding
-            text = f"{name}. {description}. Tags: {tags_str}"
+        text = custom_text or self.embedding_text(version)
 
         # Generate embedding
         embedding = await self.generate_embedding(text)
@@ -12,7 +12,10 @@ import json
 
 import structlog
 
-from open_skills.config import settings
+from open_skills.config import get_settings
+
+# Logging configuration below reads settings at import time
+settings = get_settings()
 
 
 # Configure structlog for structured logging
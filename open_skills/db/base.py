@@ -7,7 +7,27 @@ from typing import AsyncGenerator
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
-from open_skills.config import settings
+from open_skills.config import get_settings
+
+# orjson for JSONB column (de)serialization: run payloads/outputs go
+# through this on every flush, and the C implementation is several times
+# faster than stdlib json (and handles UUID/datetime natively).
+try:
+    import orjson
+
+    def json_serializer(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    json_deserializer = orjson.loads
+except ImportError:  # pragma: no cover - orjson is an optional speedup
+    import json
+
+    json_serializer = json.dumps
+    json_deserializer = json.loads
+
+# Engine construction below needs settings, so this module binds them at
+# import; modules that don't import db.base stay settings-free.
+settings = get_settings()
 
 
 # SQLAlchemy async engine
@@ -17,6 +37,12 @@ engine = create_async_engine(
     pool_size=settings.db_pool_size,
     max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,  # Verify connections before using
+    # Larger compiled-statement cache: the app re-executes a small set of
+    # statements at high frequency (manifest, runs, artifacts), so keep
+    # their compilations resident instead of recompiling under churn
+    query_cache_size=1200,
+    json_serializer=json_serializer,
+    json_deserializer=json_deserializer,
 )
 
 # Session factory
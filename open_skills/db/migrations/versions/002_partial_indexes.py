@@ -0,0 +1,42 @@
+"""Partial indexes for manifest queries
+
+Revision ID: 002
+Revises: 001
+Create Date: 2025-01-01 00:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '002'
+down_revision: Union[str, None] = '001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Covers the manifest query (is_published filter + per-skill
+    # created_at DESC ordering) so the planner reads the index instead of
+    # scanning and sorting the heap
+    op.create_index(
+        'idx_skill_versions_skill_published',
+        'skill_versions',
+        ['skill_id', sa.text('created_at DESC')],
+        postgresql_where=sa.text('is_published'),
+    )
+
+    # Covers the org-visibility branch of the manifest's access filter
+    op.create_index(
+        'idx_skills_org_visibility',
+        'skills',
+        ['org_id'],
+        postgresql_where=sa.text("visibility = 'org'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_skills_org_visibility', table_name='skills')
+    op.drop_index('idx_skill_versions_skill_published', table_name='skill_versions')
@@ -17,6 +17,7 @@ from sqlalchemy import (
     CheckConstraint,
     Index,
     JSON,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -153,6 +154,12 @@ class Skill(Base):
         ),
         Index("idx_skills_owner_id", "owner_id"),
         Index("idx_skills_org_id", "org_id"),
+        # Partial index for the manifest's org-visibility filter
+        Index(
+            "idx_skills_org_visibility",
+            "org_id",
+            postgresql_where=text("visibility = 'org'"),
+        ),
     )
 
     def __repr__(self) -> str:
@@ -181,6 +188,10 @@ class SkillVersion(Base):
     embedding: Mapped[Optional[list[float]]] = mapped_column(
         Vector(1536),  # OpenAI text-embedding-3-large dimension
         nullable=True,
+        # Deferred: the vector is ~12KB per row and only ever written or
+        # compared in SQL (similarity search), never read back through the
+        # ORM — don't ship it on every entity load
+        deferred=True,
     )
     bundle_path: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     is_published: Mapped[bool] = mapped_column(Boolean, nullable=False, default=False)
@@ -200,6 +211,15 @@ class SkillVersion(Base):
     __table_args__ = (
         Index("idx_skill_versions_skill_id", "skill_id"),
         Index("idx_skill_versions_published", "is_published"),
+        # Partial index covering the manifest query: published versions
+        # per skill, newest first, so the planner satisfies the filter and
+        # ORDER BY without a heap scan + sort
+        Index(
+            "idx_skill_versions_skill_published",
+            "skill_id",
+            text("created_at DESC"),
+            postgresql_where=text("is_published"),
+        ),
         Index(
             "idx_skill_versions_embedding",
             "embedding",
@@ -13,7 +13,10 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from open_skills.service.api.router import router
-from open_skills.config import settings
+from open_skills.config import get_settings
+
+# Service mode builds the app at import, so settings are bound here
+settings = get_settings()
 from open_skills.core.telemetry import logger
 from open_skills.db.base import dispose_db
 